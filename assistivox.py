@@ -11,10 +11,23 @@ from pathlib import Path
 # Ensure we're using the virtual environment's Python
 venv_path = Path.home() / ".assistivox" / "venv"
 if venv_path.exists() and sys.prefix != str(venv_path):
-    # Activate the virtual environment
-    activate_this = venv_path / "bin" / "activate_this.py"
-    if activate_this.exists():
-        exec(open(activate_this).read(), {'__file__': activate_this})
+    # Activate the virtual environment by adding its site-packages directly
+    import site
+    venv_site = venv_path / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+    if venv_site.exists():
+        sys.prefix = str(venv_path)
+        sys.exec_prefix = str(venv_path)
+        # addsitedir appends, so move the venv entries ahead of the system ones
+        path_count = len(sys.path)
+        site.addsitedir(str(venv_site))
+        venv_entries = sys.path[path_count:]
+        del sys.path[path_count:]
+        sys.path[:0] = venv_entries
+    else:
+        # Fall back to the venv's own activation script
+        activate_this = venv_path / "bin" / "activate_this.py"
+        if activate_this.exists():
+            exec(open(activate_this).read(), {'__file__': activate_this})
 
 def detect_crostini():
     """Detect if we're running in Chrome OS Crostini"""
@@ -33,35 +46,18 @@ def detect_crostini():
         pass
     return False
 
-def main():
-    """Main entry point for Assistivox"""
-    # Handle multiprocessing for frozen apps
-    multiprocessing.freeze_support()
-    
-    # Set multiprocessing start method
-    try:
-        multiprocessing.set_start_method('spawn')
-    except RuntimeError:
-        pass  # Already set
-    
-    # Check command line arguments
-    dev_mode = '-d' in sys.argv or '--dev' in sys.argv
-    
-    # Detect Crostini and set appropriate backend
-    if detect_crostini():
-        print("Detected Chrome OS Crostini environment")
-        # Try to use XCB first, but don't force it if libraries are missing
-        # Instead, we'll configure Wayland with better settings
-        os.environ['QT_WAYLAND_FORCE_DPI'] = 'physical'
-        os.environ['QT_WAYLAND_DISABLE_WINDOWDECORATION'] = '1'
-        # Reduce Wayland timeout issues
-        os.environ['QT_WAYLAND_RECONNECT'] = '1'
-    
-    # Import Qt modules after setting environment
+def _get_assistivox_dir(dev_mode):
+    """Return the .assistivox directory for this run"""
+    if dev_mode:
+        return Path.cwd() / ".assistivox"
+    return Path.home() / ".assistivox"
+
+def _bootstrap_qt():
+    """Create the application and show a blank splash as early as possible"""
     from PySide6.QtWidgets import QApplication, QSplashScreen
-    from PySide6.QtCore import Qt
     from PySide6.QtGui import QPixmap
-    
+    from PySide6.QtCore import Qt
+
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     
@@ -70,26 +66,53 @@ def main():
     app.setApplicationName("Assistivox")
     app.setOrganizationName("Assistivox")
     
-    # Create and show splash screen immediately with icon and text
+    # Show an empty splash immediately; the artwork is drawn afterwards
+    splash_pix = QPixmap(600, 200)
+    splash_pix.fill(Qt.black)
+
+    splash = QSplashScreen(splash_pix)
+    splash.show()
+    app.processEvents()  # Force splash to appear first
+
+    return app, splash
+
+def _render_splash_pixmap(dev_mode):
+    """Return the splash artwork, using the cached PNG when it is current"""
+    # Determine the path to the icons directory in .assistivox
+    icons_dir = _get_assistivox_dir(dev_mode) / "src" / "icons"
+    icon_path = icons_dir / "assistivox-waveform_512.png"
+    cache_path = icons_dir / "splash.png"
+
+    return _build_splash_pixmap(icon_path, cache_path)
+
+def _build_splash_pixmap(icon_path, cache_path):
+    """
+    Draw the splash icon and title into a pixmap
+    
+    The result is saved to cache_path and reused on later launches until
+    the icon file is newer than the cache.
+    """
+    from PySide6.QtGui import QPixmap, QPainter, QFont
+    from PySide6.QtCore import Qt
+
+    # Reuse the pre-rendered splash if the icon hasn't changed since
+    try:
+        if cache_path.exists() and cache_path.stat().st_mtime >= icon_path.stat().st_mtime:
+            cached_pix = QPixmap(str(cache_path))
+            if not cached_pix.isNull():
+                return cached_pix
+    except OSError:
+        pass
+
     splash_pix = QPixmap(600, 200)
     splash_pix.fill(Qt.black)
 
     # Create a painter to draw on the splash screen
-    from PySide6.QtGui import QPainter, QFont
     painter = QPainter(splash_pix)
 
     # Load the PNG icon from .assistivox directory
     icon_loaded = False
     try:
-        # Determine the path to the icons directory in .assistivox
-        if dev_mode:
-            assistivox_dir = Path.cwd() / ".assistivox"
-        else:
-            assistivox_dir = Path.home() / ".assistivox"
-        
-        icons_dir = assistivox_dir / "src" / "icons"
-        icon_path = icons_dir / "assistivox-waveform_512.png"
-    
         if icon_path.exists():
             icon_pixmap = QPixmap(str(icon_path))
             if not icon_pixmap.isNull():
@@ -121,12 +144,71 @@ def main():
 
     painter.end()
 
-    splash = QSplashScreen(splash_pix)
+    # Only cache the complete artwork so a missing icon is retried next launch
+    if icon_loaded and not splash_pix.save(str(cache_path), "PNG"):
+        print(f"Could not cache splash image at {cache_path}")
+
+    return splash_pix
+
+def _prewarm_text_stack(dev_mode):
+    """Load and exercise the markdown and sentence detection stack once"""
+    from PySide6.QtGui import QTextDocument
+    from gui.components.markdown_handler import MarkdownHandler
+    from gui.nlp.sentence_detector import get_shared_detector
+
+    try:
+        warm_doc = QTextDocument()
+        MarkdownHandler.markdown_to_rich_text(warm_doc, "# warm\n\nhello")
+
+        # Leaves the shared detector ready for the first clipboard or TTS load
+        config_path = os.path.join(_get_assistivox_dir(dev_mode), "config.json")
+        get_shared_detector(config_path).detect_sentences_in_document(warm_doc)
+    except Exception as e:
+        print(f"Could not prewarm text components: {e}")
+
+def main():
+    """Main entry point for Assistivox"""
+    # Handle multiprocessing for frozen apps
+    multiprocessing.freeze_support()
+    
+    # Set multiprocessing start method. On Linux, forkserver forks workers from a
+    # small single-threaded server process, which is much faster than spawn and,
+    # unlike plain fork, never forks the threaded Qt/CUDA process itself.
+    if sys.platform.startswith('linux'):
+        start_method = 'forkserver'
+    else:
+        start_method = 'spawn'
+    try:
+        multiprocessing.set_start_method(start_method)
+    except RuntimeError:
+        pass  # Already set
+    
+    # Check command line arguments
+    dev_mode = '-d' in sys.argv or '--dev' in sys.argv
+    
+    # Detect Crostini and set appropriate backend
+    if detect_crostini():
+        print("Detected Chrome OS Crostini environment")
+        # Try to use XCB first, but don't force it if libraries are missing
+        # Instead, we'll configure Wayland with better settings
+        os.environ['QT_WAYLAND_FORCE_DPI'] = 'physical'
+        os.environ['QT_WAYLAND_DISABLE_WINDOWDECORATION'] = '1'
+        # Reduce Wayland timeout issues
+        os.environ['QT_WAYLAND_RECONNECT'] = '1'
+    
+    # Show the splash with the minimum Qt surface before anything else loads
+    app, splash = _bootstrap_qt()
+
+    # Draw the icon and title now that the splash is already on screen
+    splash.setPixmap(_render_splash_pixmap(dev_mode))
+    app.processEvents()
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QFont
+
     # Set larger font for splash messages to improve accessibility
     splash_font = QFont("Arial", 15, QFont.Normal)
     splash.setFont(splash_font)
-    splash.show()
-    app.processEvents()  # Force splash to appear first
 
     splash.showMessage("Starting Assistivox AI...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
     app.processEvents()  # Show first message
@@ -135,6 +217,9 @@ def main():
     splash.showMessage("Loading interface components...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
     app.processEvents()  # Update splash message
 
+    # Pay the markdown and NLP cold-start cost while the splash is visible
+    _prewarm_text_stack(dev_mode)
+
     from gui.main_window import AssistivoxMainWindow
     
     # Create main window with progress updates
@@ -1,11 +1,16 @@
 # gui/clipboard_reader_window.py
-from PySide6.QtWidgets import QApplication, QLabel
+import os
+
+from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeySequence, QShortcut
 
 from gui.components.readonly_tts_widget import ReadOnlyTTSWidget
 from gui.components.markdown_handler import MarkdownHandler
 
+# Debug output for focus and activation events, off unless ASSISTIVOX_DEBUG=1
+_DEBUG = os.environ.get('ASSISTIVOX_DEBUG') == '1'
+
 class ClipboardReaderWindow(ReadOnlyTTSWidget):
     """
     Clipboard reader window that inherits from ReadOnlyTTSWidget
@@ -13,7 +18,7 @@ class ClipboardReaderWindow(ReadOnlyTTSWidget):
     This provides the same interface and navigation as the TTS widget
     but loads content from the clipboard instead of from a text editor.
     """
-    
+
     def __init__(self, config=None, assistivox_dir=None, main_window=None, parent=None):
         # Initialize the parent ReadOnlyTTSWidget
         super().__init__(parent, config, assistivox_dir)
@@ -25,13 +30,19 @@ class ClipboardReaderWindow(ReadOnlyTTSWidget):
         self.setWindowFlags(Qt.Window)
         self.setWindowTitle("Clipboard Reader")
         
-        # Override the header text - find the header label and update it
-        from PySide6.QtWidgets import QLabel
-        header_labels = self.findChildren(QLabel)
-        for label in header_labels:
-            if "Text-to-Speech Reader" in label.text():
-                label.setText("Clipboard Reader (Ctrl+Alt+V)")
-                break
+        # Text of the clipboard content that is currently rendered
+        self._last_clipboard_text = ""
+        
+        # Only re-read the clipboard after it reports a change
+        self._clipboard_dirty = True
+        self._watching_clipboard = False
+        self._watch_clipboard(True)
+        
+        # TTS auto-start waiting on background sentence detection
+        self._autostart_pending = False
+        
+        # Override the header text
+        self.header_label.setText("Clipboard Reader (Ctrl+Alt+V)")
         
         # Remove shortcuts we don't want for clipboard reader
         self.remove_unwanted_shortcuts()
@@ -42,44 +53,52 @@ class ClipboardReaderWindow(ReadOnlyTTSWidget):
     def remove_unwanted_shortcuts(self):
         """Remove shortcuts that don't apply to clipboard reader"""
         # Remove Alt+O (open original PDF) shortcut
-        if hasattr(self, 'original_pdf_shortcut'):
-            self.original_pdf_shortcut.setEnabled(False)
+        self.original_pdf_shortcut.setEnabled(False)
         
         # Remove Alt+G (go to page) shortcut
-        if hasattr(self, 'go_to_page_shortcut'):
-            self.go_to_page_shortcut.setEnabled(False)
-        
-        # Remove page navigation shortcuts (Shift+Ctrl+PgUp/PgDown)
-        # These are handled in keyPressEvent, so we'll override that method
+        self.go_to_page_shortcut.setEnabled(False)
     
-    def load_clipboard_content(self):
-        """Load content from clipboard and render as markdown"""
+    def load_clipboard_content(self, force=False):
+        """Load content from clipboard and render as markdown
+        
+        Args:
+            force: Reload even if the clipboard text has not changed
+        """
+        # Nothing to do unless the clipboard changed since the last load
+        if not force and not self._clipboard_dirty:
+            return
+        self._clipboard_dirty = False
+        
         clipboard = QApplication.clipboard()
         text = clipboard.text()
         
+        # Skip parsing and sentence detection when the clipboard is unchanged
+        if not force and text == self._last_clipboard_text:
+            return
+        
         if text:
             # Parse markdown structure FIRST
             self.markdown_structure = self._parse_markdown_to_structure(text)
             
-            # Use MarkdownHandler to convert the text to rich text
-            MarkdownHandler.markdown_to_rich_text(self.text_edit.document(), text)
+            # When new paragraphs were only appended, render and detect just those
+            appended = False
+            if not force and self._can_append_clipboard_text(text):
+                try:
+                    self._append_clipboard_text(text[len(self._last_clipboard_text):])
+                    appended = True
+                except Exception as e:
+                    print(f"Error appending clipboard content, reloading: {e}")
             
-            # Run sentence boundary detection to get sentence_boundary_data
-            try:
-                from gui.nlp.sentence_detector import SentenceDetector
-                import os
-                
-                config_path = os.path.join(self.assistivox_dir, "config.json")
-                detector = SentenceDetector(config_path)
-                self.sentence_boundary_data = detector.detect_sentences_in_document(self.text_edit.document())
-                
-                # NOW map headings to positions (this was missing!)
-                self._map_headings_to_positions()
+            if not appended:
+                # Use MarkdownHandler to convert the text to rich text
+                MarkdownHandler.markdown_to_rich_text(self.text_edit.document(), text)
+                self._split_long_blocks(self.text_edit.document())
                 
-            except Exception as e:
-                print(f"DEBUG: Error in sentence detection: {e}")
-                self.sentence_boundary_data = []
+                # Run sentence boundary detection in the background; navigation data
+                # is filled in by _on_sentence_detection_complete
+                self.sentence_boundary_data = None
                 self.heading_positions = {}
+                self._start_sentence_detection()
             
             # Reset TTS sentence index when loading new clipboard content
             if self.tts_manager:
@@ -91,58 +110,145 @@ class ClipboardReaderWindow(ReadOnlyTTSWidget):
             self.heading_positions = {}
             self.markdown_structure = []
             self.sentence_boundary_data = None
+            self._detection_thread = None
+        
+        self._last_clipboard_text = text
+
+    def _on_clipboard_changed(self):
+        """Mark the clipboard for reloading on the next load request"""
+        self._clipboard_dirty = True
+
+    def _watch_clipboard(self, enabled):
+        """Connect or disconnect the clipboard change notification"""
+        if enabled == self._watching_clipboard:
+            return
+        clipboard = QApplication.clipboard()
+        if enabled:
+            clipboard.dataChanged.connect(self._on_clipboard_changed)
+        else:
+            clipboard.dataChanged.disconnect(self._on_clipboard_changed)
+        self._watching_clipboard = enabled
+
+    def _can_append_clipboard_text(self, text):
+        """Check whether text only adds new markdown blocks after the rendered clipboard text"""
+        previous = self._last_clipboard_text
+        if not previous or len(text) <= len(previous) or not text.startswith(previous):
+            return False
+        
+        # Existing sentence data must be complete before it can be extended
+        if self._detection_thread is not None or not self.sentence_boundary_data:
+            return False
+        
+        # The new text must start after a blank line and outside a code fence,
+        # otherwise it would continue the last paragraph, list or code block
+        boundary = len(previous)
+        if '\n\n' not in text[max(0, boundary - 2):boundary + 2]:
+            return False
+        return previous.count('```') % 2 == 0
+
+    def _append_clipboard_text(self, appended_text):
+        """Render appended markdown at the end of the document and detect only its sentences"""
+        from PySide6.QtGui import QTextDocument, QTextCursor, QTextBlockFormat, QTextCharFormat
+        from gui.nlp.sentence_detector import get_shared_detector
+        
+        document = self.text_edit.document()
+        
+        # Render the new part on its own, with the same default font for font sizes
+        appended_doc = QTextDocument()
+        appended_doc.setDefaultFont(document.defaultFont())
+        MarkdownHandler.markdown_to_rich_text(appended_doc, appended_text)
+        self._split_long_blocks(appended_doc)
+        
+        config_path = os.path.join(self.assistivox_dir, "config.json")
+        appended_data = get_shared_detector(config_path).detect_sentences_in_document(appended_doc)
+        
+        # Add the rendered blocks after the existing ones
+        appended_cursor = QTextCursor(appended_doc)
+        appended_cursor.select(QTextCursor.Document)
+        
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+        cursor.insertFragment(appended_cursor.selection())
+        cursor.endEditBlock()
+        
+        # Block order is unchanged, so the new sentence data simply follows the old
+        self.sentence_boundary_data = self.sentence_boundary_data + appended_data
+        self.heading_positions = {}
+        self._map_headings_to_positions()
+
+    def _on_sentence_detection_complete(self, sentence_data):
+        """Store detection results and run any TTS auto-start that was waiting"""
+        super()._on_sentence_detection_complete(sentence_data)
+        
+        # Results for replaced content leave the newer detection running
+        if self._detection_thread is None and self._autostart_pending:
+            self._autostart_pending = False
+            self._autostart_tts()
 
     def changeEvent(self, event):
         """Handle window state changes"""
         if event.type() == event.Type.ActivationChange:
             if self.isActiveWindow():
-                print("DEBUG: Clipboard reader window activated")
+                if _DEBUG:
+                    print("DEBUG: Clipboard reader window activated")
                 # Re-sync TTS state when window regains focus
-                if hasattr(self, 'tts_manager') and self.tts_manager:
+                if self.tts_manager is not None:
                     if (self.tts_manager.tts_worker and 
                         self.tts_manager.tts_worker.isRunning()):
                         # Worker is running, ensure UI reflects this
                         if not self.tts_manager.is_speaking:
-                            print("DEBUG: Worker running but is_speaking False - correcting")
+                            if _DEBUG:
+                                print("DEBUG: Worker running but is_speaking False - correcting")
                             self.tts_manager.is_speaking = True
-                        if hasattr(self, 'play_pause_button'):
-                            self.play_pause_button.setText("Pause (Alt+S)")
+                        self.play_pause_button.setText("Pause (Alt+S)")
                     else:
                         # No worker running, ensure UI reflects this
                         if self.tts_manager.is_speaking:
-                            print("DEBUG: No worker but is_speaking True - correcting")
+                            if _DEBUG:
+                                print("DEBUG: No worker but is_speaking True - correcting")
                             self.tts_manager.is_speaking = False
-                        if hasattr(self, 'play_pause_button'):
-                            self.play_pause_button.setText("Play (Alt+S)")
+                        self.play_pause_button.setText("Play (Alt+S)")
         
         super().changeEvent(event)
 
     def focusInEvent(self, event):
         """Handle focus in events"""
-        print("DEBUG: Clipboard reader focus in")
+        if _DEBUG:
+            print("DEBUG: Clipboard reader focus in")
         # Ensure TTS state consistency when focus returns
-        if hasattr(self, 'tts_manager') and self.tts_manager:
+        if self.tts_manager is not None:
             if (self.tts_manager.tts_worker and
                 self.tts_manager.tts_worker.isRunning() and
                 not self.tts_manager.is_speaking):
-                print("DEBUG: Correcting TTS speaking flag on focus in")
+                if _DEBUG:
+                    print("DEBUG: Correcting TTS speaking flag on focus in")
                 self.tts_manager.is_speaking = True
-                if hasattr(self, 'play_pause_button'):
-                    self.play_pause_button.setText("Pause (Alt+S)")
+                self.play_pause_button.setText("Pause (Alt+S)")
     
         super().focusInEvent(event)
     
     def focusOutEvent(self, event):
         """Handle focus out events"""
-        print("DEBUG: Clipboard reader focus out")
+        if _DEBUG:
+            print("DEBUG: Clipboard reader focus out")
         super().focusOutEvent(event)
     
     def showEvent(self, event):
         """Override show event to load clipboard contents and auto-start TTS"""
         super().showEvent(event)
+        self._watch_clipboard(True)
         self.load_clipboard_content()
         
-        # Auto-start TTS from first sentence if content exists
+        # Wait for background sentence detection before speaking
+        if self._detection_thread is not None:
+            self._autostart_pending = True
+        else:
+            self._autostart_tts()
+
+    def _autostart_tts(self):
+        """Start TTS from the first sentence if content exists"""
         if self.text_edit.document() and not self.text_edit.document().isEmpty():
             # Set to first sentence of first block
             if self.tts_manager:
@@ -152,6 +258,15 @@ class ClipboardReaderWindow(ReadOnlyTTSWidget):
                 # Navigate to first sentence to make it visible
                 self.tts_manager._navigate_to_sentence(0, 0)
 
+    def closeEvent(self, event):
+        """Stop watching the clipboard while the window is closed"""
+        self._watch_clipboard(False)
+        # Changes can't be tracked while closed, so re-check on the next show
+        self._clipboard_dirty = True
+        # Detection still finishing in the background must not start speech
+        self._autostart_pending = False
+        super().closeEvent(event)
+
     def open_original_pdf(self):
         """Override to disable PDF opening for clipboard reader"""
         # This method exists in parent but doesn't apply to clipboard reader
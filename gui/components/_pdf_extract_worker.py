@@ -0,0 +1,240 @@
+# gui/components/_pdf_extract_worker.py
+"""
+PDF extraction worker run in a separate process by PDFExtractionDialog
+
+Usage: python -m gui.components._pdf_extract_worker PDF_PATH START_PAGE END_PAGE OUTPUT_PATH
+
+END_PAGE may be -1 to extract through the last page. Progress is reported
+on stdout as fixed-size PROGRESS_RECORD messages; anything else the worker
+or its libraries print goes to stderr.
+"""
+
+import os
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Progress message: 1-byte type followed by a little-endian uint32 value
+PROGRESS_RECORD = struct.Struct('<BI')
+MSG_TOTAL_PAGES = 1
+MSG_PAGE_COMPLETE = 2
+
+# Pages converted per docling call; progress is reported and OCR is decided
+# for each chunk
+_PROGRESS_CHUNK_PAGES = 4
+
+# Smallest page share worth its own process; each one loads its own docling models
+_MIN_PAGES_PER_WORKER = 8
+# Upper bound on extraction processes, to keep the model memory bounded
+_MAX_WORKERS = 4
+
+
+def _detect_gpu():
+    """Detect if a CUDA GPU is available and properly configured"""
+    try:
+        import torch
+        return torch.cuda.is_available() and torch.cuda.device_count() > 0
+    except ImportError:
+        return False
+
+
+def _has_text_layer(reader, start_page, end_page):
+    """Check whether every page of the range already contains extractable text"""
+    try:
+        for page_num in range(start_page, end_page + 1):
+            if not reader.pages[page_num - 1].extract_text().strip():
+                return False
+    except Exception:
+        return False
+    return True
+
+
+def _create_converter(do_ocr, use_gpu, num_threads):
+    """Create a docling converter for PDFs with the given pipeline settings"""
+    from docling.document_converter import DocumentConverter
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import PdfFormatOption
+    try:
+        from docling.datamodel.accelerator_options import AcceleratorOptions, AcceleratorDevice
+    except ImportError:
+        # Older docling releases keep these with the pipeline options
+        from docling.datamodel.pipeline_options import AcceleratorOptions, AcceleratorDevice
+
+    # Set up pipeline options
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = do_ocr
+    pipeline_options.do_table_structure = True
+    pipeline_options.table_structure_options.do_cell_matching = True
+
+    # Run the models on the GPU when there is one, otherwise on the given CPU threads
+    pipeline_options.accelerator_options = AcceleratorOptions(
+        device=AcceleratorDevice.CUDA if use_gpu else AcceleratorDevice.CPU,
+        num_threads=num_threads
+    )
+
+    # Create converter with pipeline options
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
+
+# Converters of the current pool process by do_ocr, created on first use
+_pool_converters = {}
+_pool_num_threads = 1
+
+
+def _init_pool_process(parent_pid, num_threads):
+    """
+    Pool process initializer: exit as soon as the extraction process is gone
+    
+    Cancelling kills only the extraction process, which would otherwise leave
+    its pool processes converting their pages.
+    """
+    global _pool_num_threads
+    _pool_num_threads = num_threads
+
+    def watch_parent():
+        while os.getppid() == parent_pid:
+            time.sleep(0.5)
+        os._exit(1)
+    threading.Thread(target=watch_parent, daemon=True).start()
+
+
+def _convert_pages(doc_converter, pdf_path, start_page, end_page):
+    """
+    Convert a contiguous page range with the given converter
+    
+    Returns:
+        list: Markdown for each page of the range, in page order
+    """
+    document = doc_converter.convert(pdf_path, page_range=(start_page, end_page)).document
+    return [document.export_to_markdown(page_no=page_num)  # Docling is 1-indexed
+            for page_num in range(start_page, end_page + 1)]
+
+
+def _extract_chunk(pdf_path, start_page, end_page, do_ocr):
+    """Convert a page chunk with the pool process converter for do_ocr"""
+    doc_converter = _pool_converters.get(do_ocr)
+    if doc_converter is None:
+        doc_converter = _create_converter(do_ocr, False, _pool_num_threads)
+        _pool_converters[do_ocr] = doc_converter
+    return _convert_pages(doc_converter, pdf_path, start_page, end_page)
+
+
+def main():
+    """Extract the requested page range to ASVX markdown"""
+    # Keep the real stdout for progress records and send all text output to
+    # stderr, so library prints can't corrupt the binary stream
+    progress_out = os.fdopen(os.dup(1), 'wb', buffering=0)
+    os.dup2(2, 1)
+
+    def report(msg, value):
+        progress_out.write(PROGRESS_RECORD.pack(msg, value))
+
+    try:
+        pdf_path, start_page, end_page, output_path = sys.argv[1:5]
+        start_page = int(start_page)
+        end_page = int(end_page)
+
+        from pypdf import PdfReader
+
+        # Get PDF page count using pypdf
+        reader = PdfReader(pdf_path)
+        num_pages = len(reader.pages)
+
+        # Use page range or full document
+        if end_page < 1:
+            end_page = num_pages
+
+        # Ensure valid range
+        start_page = max(1, min(start_page, num_pages))
+        end_page = max(start_page, min(end_page, num_pages))
+
+        page_count = end_page - start_page + 1
+
+        # Report total pages in range
+        report(MSG_TOTAL_PAGES, page_count)
+
+        use_gpu = _detect_gpu()
+        cpu_count = os.cpu_count() or 4
+
+        # Pages are converted in small chunks so progress follows the real
+        # work. Long ranges on the CPU spread the chunks over a few pool
+        # processes; the GPU is shared, so it keeps a single converter
+        chunks = [(chunk_start, min(chunk_start + _PROGRESS_CHUNK_PAGES - 1, end_page))
+                  for chunk_start in range(start_page, end_page + 1, _PROGRESS_CHUNK_PAGES)]
+        # Born-digital pages already carry their text, OCR is only needed for
+        # chunks with scanned pages
+        chunk_ocr = {chunk_start: not _has_text_layer(reader, chunk_start, chunk_end)
+                     for chunk_start, chunk_end in chunks}
+        num_workers = 1
+        if not use_gpu:
+            num_workers = min(_MAX_WORKERS, cpu_count, max(1, page_count // _MIN_PAGES_PER_WORKER))
+
+        pages_done = 0
+        if num_workers == 1:
+            doc_converters = {}
+            page_markdown = []
+            for chunk_start, chunk_end in chunks:
+                do_ocr = chunk_ocr[chunk_start]
+                if do_ocr not in doc_converters:
+                    doc_converters[do_ocr] = _create_converter(do_ocr, use_gpu, cpu_count)
+                page_markdown.extend(_convert_pages(doc_converters[do_ocr], pdf_path,
+                                                    chunk_start, chunk_end))
+                # Report progress after each chunk
+                pages_done += chunk_end - chunk_start + 1
+                report(MSG_PAGE_COMPLETE, pages_done)
+        else:
+            chunk_results = {}
+            with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_pool_process,
+                                     initargs=(os.getpid(),
+                                               max(1, cpu_count // num_workers))) as executor:
+                futures = {
+                    executor.submit(_extract_chunk, pdf_path, chunk_start, chunk_end,
+                                    chunk_ocr[chunk_start]): chunk_start
+                    for chunk_start, chunk_end in chunks
+                }
+                for future in as_completed(futures):
+                    chunk_results[futures[future]] = future.result()
+                    # Report progress as each chunk finishes
+                    pages_done += len(chunk_results[futures[future]])
+                    report(MSG_PAGE_COMPLETE, pages_done)
+            # Chunks finish in any order, join them back in page order
+            page_markdown = [md_text for chunk_start, chunk_end in chunks
+                             for md_text in chunk_results[chunk_start]]
+
+        # Build ASVX content page by page
+        asvx_parts = []
+
+        for page_num, md_text in enumerate(page_markdown, start_page):
+            # Add ASVX page tag with actual PDF page number
+            asvx_parts.append(f"{{asvx|page|num:{page_num}}}\n\n")
+
+            # Add the page content
+            asvx_parts.append(md_text)
+
+            # Add spacing between pages (except for the last page)
+            if page_num < end_page:
+                asvx_parts.append("\n\n")
+
+        # Combine all parts into final ASVX content
+        final_asvx = "".join(asvx_parts)
+
+        # Write result to output file
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(final_asvx)
+
+        print("SUCCESS")
+
+    except Exception as e:
+        print(f"ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
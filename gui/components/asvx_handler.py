@@ -1,8 +1,72 @@
 # gui/components/asvx_handler.py
 import re
-from pathlib import Path
+import functools
 from PySide6.QtGui import QTextDocument
 
+# A line holding a single ASVX tag, e.g. {asvx|page|num:24}; group 1 is the tag body
+_ASVX_TAG_RE = re.compile(r'^[ \t\r]*\{asvx\|(.*)\}[ \t\r]*$', re.MULTILINE)
+
+# A "PAGE BREAK N" marker line as written by the markdown export
+_PAGE_BREAK_RE = re.compile(r'^PAGE BREAK (\d+)$')
+
+# Formats shared by every asvx_to_rich_text call, created on first use
+_PAGE_BLOCK_FMT_FIRST = None
+_PAGE_BLOCK_FMT_PREV = None
+_PAGE_BLOCK_FMT_CURR = None
+_PAGE_CHAR_FMT_BOLD = None
+_DEFAULT_BLOCK_FMT = None
+_DEFAULT_CHAR_FMT = None
+
+def _init_formats():
+    """Create the shared page header and default formats once"""
+    global _PAGE_BLOCK_FMT_FIRST, _PAGE_BLOCK_FMT_PREV, _PAGE_BLOCK_FMT_CURR
+    global _PAGE_CHAR_FMT_BOLD, _DEFAULT_BLOCK_FMT, _DEFAULT_CHAR_FMT
+    
+    if _PAGE_BLOCK_FMT_FIRST is not None:
+        return
+    
+    from PySide6.QtGui import QTextBlockFormat, QTextCharFormat, QFont
+    from PySide6.QtCore import Qt
+    
+    # First page number, and current page number below a page transition
+    _PAGE_BLOCK_FMT_FIRST = QTextBlockFormat()
+    _PAGE_BLOCK_FMT_FIRST.setAlignment(Qt.AlignCenter)
+    _PAGE_BLOCK_FMT_FIRST.setTopMargin(5)
+    _PAGE_BLOCK_FMT_FIRST.setBottomMargin(20)
+    _PAGE_BLOCK_FMT_CURR = QTextBlockFormat(_PAGE_BLOCK_FMT_FIRST)
+    
+    # Previous page number above a page transition
+    _PAGE_BLOCK_FMT_PREV = QTextBlockFormat()
+    _PAGE_BLOCK_FMT_PREV.setAlignment(Qt.AlignCenter)
+    _PAGE_BLOCK_FMT_PREV.setTopMargin(20)
+    _PAGE_BLOCK_FMT_PREV.setBottomMargin(5)
+    
+    _PAGE_CHAR_FMT_BOLD = QTextCharFormat()
+    _PAGE_CHAR_FMT_BOLD.setFontWeight(QFont.Bold)
+    
+    _DEFAULT_BLOCK_FMT = QTextBlockFormat()
+    _DEFAULT_CHAR_FMT = QTextCharFormat()
+
+@functools.lru_cache(maxsize=256)
+def _render_markdown_fragment(markdown_text):
+    """
+    Render a markdown chunk to a QTextDocumentFragment
+    
+    Repeated chunks (running headers/footers on every page) are served
+    from the cache instead of being parsed again.
+    """
+    from gui.components.markdown_handler import MarkdownHandler
+    from PySide6.QtGui import QTextCursor
+    
+    # Use MarkdownHandler instead of insertHtml to preserve editor font
+    temp_doc = QTextDocument()
+    MarkdownHandler.markdown_to_rich_text(temp_doc, markdown_text)
+    
+    # The fragment keeps its own copy, so the temporary document can go
+    temp_cursor = QTextCursor(temp_doc)
+    temp_cursor.select(QTextCursor.Document)
+    return temp_cursor.selection()
+
 class ASVXHandler:
     """
     Handler for ASVX (Assistivox Format) documents
@@ -28,20 +92,22 @@ class ASVXHandler:
         return filepath.lower().endswith('.asvx')
     
     @staticmethod
-    def asvx_to_rich_text(document, asvx_content):
+    def asvx_to_rich_text(document, asvx_content, pdf_path=None):
         """
         Convert ASVX content to rich text and load it into a QTextDocument
         
         Args:
             document: The QTextDocument to load content into
             asvx_content: The ASVX content to convert
+            pdf_path: Optional original PDF path for the metadata, used instead
+                of prepending a pdf tag to freshly extracted content
             
         Returns:
             dict: Metadata extracted from ASVX tags (e.g., PDF path)
         """
-        from gui.components.markdown_handler import MarkdownHandler
-        from PySide6.QtGui import QTextCursor, QTextBlockFormat, QTextCharFormat, QFont
-        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QTextCursor
+        
+        _init_formats()
         
         # Parse ASVX content into chunks and metadata
         chunks, metadata = ASVXHandler._parse_asvx_content(asvx_content)
@@ -81,62 +147,30 @@ class ASVXHandler:
                     # First page tag - just display "PAGE X" at the beginning
                     first_page_encountered = True
                     
-                    # Create block format for first page
-                    block_format = QTextBlockFormat()
-                    block_format.setAlignment(Qt.AlignCenter)
-                    block_format.setTopMargin(5)
-                    block_format.setBottomMargin(20)
-                    
-                    # Create character format for first page
-                    char_format = QTextCharFormat()
-                    char_format.setFontWeight(QFont.Bold)
-                    
                     # Insert formatted text
-                    cursor.setBlockFormat(block_format)
-                    cursor.setCharFormat(char_format)
-                    cursor.insertText(f"PAGE {current_page_num}")
+                    cursor.setBlockFormat(_PAGE_BLOCK_FMT_FIRST)
+                    cursor.insertText(f"PAGE {current_page_num}", _PAGE_CHAR_FMT_BOLD)
                     
                     # Add spacing after first page
-                    cursor.insertText("\n")
+                    cursor.insertBlock()
                     
                 else:
-                    # Subsequent page tags - show page transition
-                    
-                    # Add spacing before page transition
-                    cursor.insertText("\n")
+                    # Subsequent page tags - show page transition. Each new block is
+                    # created with its formats in one call rather than newline + set calls
                     
                     # Above the horizontal rule: previous page number
-                    prev_block_format = QTextBlockFormat()
-                    prev_block_format.setAlignment(Qt.AlignCenter)
-                    prev_block_format.setTopMargin(20)
-                    prev_block_format.setBottomMargin(5)
-                    
-                    prev_char_format = QTextCharFormat()
-                    prev_char_format.setFontWeight(QFont.Bold)
-                    
-                    cursor.setBlockFormat(prev_block_format)
-                    cursor.setCharFormat(prev_char_format)
-                    cursor.insertText(f"PAGE {previous_page_num}")
+                    cursor.insertBlock(_PAGE_BLOCK_FMT_PREV, _PAGE_CHAR_FMT_BOLD)
+                    cursor.insertText(f"PAGE {previous_page_num}", _PAGE_CHAR_FMT_BOLD)
                     
                     # Add horizontal rule
                     cursor.insertHtml('<hr/>')
-                    cursor.insertText("\n")
                     
                     # Below the horizontal rule: current page number
-                    curr_block_format = QTextBlockFormat()
-                    curr_block_format.setAlignment(Qt.AlignCenter)
-                    curr_block_format.setTopMargin(5)
-                    curr_block_format.setBottomMargin(20)
-                    
-                    curr_char_format = QTextCharFormat()
-                    curr_char_format.setFontWeight(QFont.Bold)
-                    
-                    cursor.setBlockFormat(curr_block_format)
-                    cursor.setCharFormat(curr_char_format)
-                    cursor.insertText(f"PAGE {current_page_num}")
+                    cursor.insertBlock(_PAGE_BLOCK_FMT_CURR, _PAGE_CHAR_FMT_BOLD)
+                    cursor.insertText(f"PAGE {current_page_num}", _PAGE_CHAR_FMT_BOLD)
                     
                     # Add spacing after current page
-                    cursor.insertText("\n")
+                    cursor.insertBlock()
                 
                 previous_page_num = current_page_num
                 
@@ -144,22 +178,17 @@ class ASVXHandler:
                 # Add markdown content
                 if chunk_content.strip():
                     # Reset to default formatting for content
-                    default_block_format = QTextBlockFormat()
-                    default_char_format = QTextCharFormat()
-                    cursor.setBlockFormat(default_block_format)
-                    cursor.setCharFormat(default_char_format)
+                    cursor.setBlockFormat(_DEFAULT_BLOCK_FMT)
+                    cursor.setCharFormat(_DEFAULT_CHAR_FMT)
         
-                    # Use MarkdownHandler instead of insertHtml to preserve editor font
-                    temp_doc = QTextDocument()
-                    MarkdownHandler.markdown_to_rich_text(temp_doc, chunk_content)
-                    
                     # Copy content without HTML styling that changes fonts
-                    temp_cursor = QTextCursor(temp_doc)
-                    temp_cursor.select(QTextCursor.Document)
-                    cursor.insertFragment(temp_cursor.selection())
+                    cursor.insertFragment(_render_markdown_fragment(chunk_content))
 
         cursor.endEditBlock()
         
+        if pdf_path:
+            metadata['pdf_path'] = pdf_path
+        
         return metadata
     
     @staticmethod
@@ -179,17 +208,17 @@ class ASVXHandler:
         # Get markdown from the document
         markdown_content = MarkdownHandler.rich_text_to_markdown(document)
         
-        # Build ASVX content
-        asvx_content = ""
+        # Build ASVX content from parts joined once
+        asvx_parts = []
         
         # Add PDF tag if metadata contains PDF path
         if metadata and 'pdf_path' in metadata and metadata['pdf_path']:
-            asvx_content += "{asvx|pdf:" + metadata['pdf_path'] + "}\n\n"
+            asvx_parts.append("{asvx|pdf:" + metadata['pdf_path'] + "}\n\n")
         
         # Convert markdown with PAGE BREAK markers to ASVX format
-        asvx_content += ASVXHandler._convert_markdown_to_asvx_pages(markdown_content)
+        asvx_parts.append(ASVXHandler._convert_markdown_to_asvx_pages(markdown_content))
         
-        return asvx_content
+        return ''.join(asvx_parts)
     
     @staticmethod
     def _parse_asvx_content(asvx_content):
@@ -205,62 +234,47 @@ class ASVXHandler:
         chunks = []
         metadata = {}
         
-        lines = asvx_content.split('\n')
-        current_chunk = ""
+        def add_markdown_chunk(text):
+            # Only keep chunks with real content, without trailing newlines
+            if text.strip():
+                chunks.append({
+                    'type': 'markdown',
+                    'content': text.rstrip('\n')
+                })
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped_line = line.strip()
+        prev_end = 0
+        for match in _ASVX_TAG_RE.finditer(asvx_content):
+            # Save any content between the previous tag and this one as markdown
+            add_markdown_chunk(asvx_content[prev_end:match.start()])
+            # Continue after the tag line and its newline
+            prev_end = match.end() + 1
             
-            # Check for ASVX tags
-            if stripped_line.startswith('{asvx|') and stripped_line.endswith('}'):
-                # Save any accumulated content as markdown chunk
-                if current_chunk.strip():
-                    chunks.append({
-                        'type': 'markdown',
-                        'content': current_chunk.rstrip('\n')  # Remove trailing newlines
-                    })
-                    current_chunk = ""
-                
-                # Parse the tag
-                tag_content = stripped_line[6:-1]  # Remove {asvx| and }
-                
-                if tag_content.startswith('pdf:'):
-                    # PDF tag: {asvx|pdf:/path/to/file.pdf}
-                    pdf_path = tag_content[4:].strip()
-                    metadata['pdf_path'] = pdf_path
-                    chunks.append({
-                        'type': 'pdf_tag',
-                        'content': pdf_path
-                    })
-                elif tag_content.startswith('page'):
-                    # Page tag: {asvx|page|num:24} or {asvx|page}
-                    page_info = {}
-                    if '|' in tag_content:
-                        # Parse attributes like num:24
-                        parts = tag_content.split('|')
-                        for part in parts[1:]:  # Skip 'page' part
-                            if ':' in part:
-                                key, value = part.split(':', 1)
-                                page_info[key.strip()] = value.strip()
-                    
-                    chunks.append({
-                        'type': 'page_tag',
-                        'content': page_info
-                    })
-            else:
-                # Regular content line - add to current chunk
-                current_chunk += line + '\n'
+            tag_content = match.group(1)
             
-            i += 1
+            if tag_content.startswith('pdf:'):
+                # PDF tag: {asvx|pdf:/path/to/file.pdf}
+                pdf_path = tag_content[4:].strip()
+                metadata['pdf_path'] = pdf_path
+                chunks.append({
+                    'type': 'pdf_tag',
+                    'content': pdf_path
+                })
+            elif tag_content.startswith('page'):
+                # Page tag: {asvx|page|num:24} or {asvx|page}
+                page_info = {}
+                # Parse attributes like num:24, skipping the 'page' part
+                for part in tag_content.split('|')[1:]:
+                    key, sep, value = part.partition(':')
+                    if sep:
+                        page_info[key.strip()] = value.strip()
+                
+                chunks.append({
+                    'type': 'page_tag',
+                    'content': page_info
+                })
         
         # Add any remaining content as final markdown chunk
-        if current_chunk.strip():
-            chunks.append({
-                'type': 'markdown',
-                'content': current_chunk.rstrip('\n')  # Remove trailing newlines
-            })
+        add_markdown_chunk(asvx_content[prev_end:])
         
         return chunks, metadata
     
@@ -279,29 +293,29 @@ class ASVXHandler:
             return ""
         
         lines = markdown_content.split('\n')
-        asvx_lines = []
-        page_number = 1
+        # The first page tag goes in front of everything, so keep it apart from the body
+        prefix = []
+        body = []
         first_page_added = False
         
         i = 0
         while i < len(lines):
             line = lines[i]
+            stripped_line = line.strip()
             
             # Check for PAGE BREAK pattern: "PAGE BREAK X"
-            page_break_match = re.match(r'^PAGE BREAK (\d+)$', line.strip())
+            page_break_match = _PAGE_BREAK_RE.match(stripped_line)
             if page_break_match:
                 # This is a page break line
                 page_num = int(page_break_match.group(1))
                 
-                # Add page tag
-                asvx_lines.append(f"{{asvx|page|num:{page_num}}}")
-                asvx_lines.append("")  # Add blank line after page tag
+                # Drop the horizontal rule line that precedes the PAGE BREAK
+                if i > 0 and lines[i-1].strip() == '---' and body and body[-1] == '---':
+                    body.pop()
                 
-                # Skip the horizontal rule line if it exists before the PAGE BREAK
-                if i > 0 and lines[i-1].strip() == '---':
-                    # Remove the last added horizontal rule line
-                    if asvx_lines and asvx_lines[-3] == '---':
-                        asvx_lines.pop(-3)
+                # Add page tag
+                body.append(f"{{asvx|page|num:{page_num}}}")
+                body.append("")  # Add blank line after page tag
                 
                 # Skip any following empty lines
                 i += 1
@@ -310,19 +324,17 @@ class ASVXHandler:
                 continue
             
             # Check if we need to add the first page tag
-            if not first_page_added and line.strip() and not line.strip().startswith('#'):
+            if not first_page_added and stripped_line and not stripped_line.startswith('#'):
                 # We have content and haven't added first page tag yet
-                asvx_lines.insert(0, "{asvx|page|num:1}")
-                asvx_lines.insert(1, "")
+                prefix[:] = ["{asvx|page|num:1}", ""]
                 first_page_added = True
             
             # Add regular line
-            asvx_lines.append(line)
+            body.append(line)
             i += 1
         
         # If we have content but no page tags were added, add the first page tag
-        if not first_page_added and any(line.strip() for line in asvx_lines):
-            asvx_lines.insert(0, "{asvx|page|num:1}")
-            asvx_lines.insert(1, "")
+        if not first_page_added and any(line.strip() for line in body):
+            prefix[:] = ["{asvx|page|num:1}", ""]
         
-        return '\n'.join(asvx_lines)
+        return '\n'.join(prefix + body)
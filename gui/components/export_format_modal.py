@@ -4,7 +4,6 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QKeySequence, QShortcut
 
 
 class ExportFormatModal(QDialog):
@@ -13,6 +12,16 @@ class ExportFormatModal(QDialog):
     # Signal emitted when format is selected
     formatSelected = Signal(str)  # Emits 'text' or 'pdf'
     
+    # Keyboard shortcuts without Ctrl/Alt/Meta: key -> format to select, or 'cancel'
+    _KEY_ACTIONS = {
+        Qt.Key_Escape: 'cancel',
+        Qt.Key_T: 'text',
+        Qt.Key_P: 'pdf',
+        Qt.Key_Return: 'text',
+        Qt.Key_Enter: 'text',
+        Qt.Key_Space: 'text',
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Export Document")
@@ -27,7 +36,6 @@ class ExportFormatModal(QDialog):
             )
         
         self.setup_ui()
-        self.setup_shortcuts()
     
     def setup_ui(self):
         """Set up the user interface"""
@@ -59,6 +67,7 @@ class ExportFormatModal(QDialog):
         self.pdf_button = QPushButton("PDF (.pdf)")
         self.pdf_button.setFixedHeight(50)
         self.pdf_button.clicked.connect(lambda: self.select_format('pdf'))
+        self.pdf_button.setAutoDefault(False)  # Enter always selects text
         buttons_layout.addWidget(self.pdf_button)
         
         layout.addLayout(buttons_layout)
@@ -69,6 +78,7 @@ class ExportFormatModal(QDialog):
         
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
+        cancel_button.setAutoDefault(False)  # Enter always selects text
         cancel_layout.addWidget(cancel_button)
         
         layout.addLayout(cancel_layout)
@@ -76,37 +86,25 @@ class ExportFormatModal(QDialog):
         # Set focus to text button by default
         self.text_button.setFocus()
     
-    def setup_shortcuts(self):
-        """Set up keyboard shortcuts"""
-        # Escape to cancel
-        self.escape_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
-        self.escape_shortcut.activated.connect(self.reject)
-        
-        # T for text
-        self.text_shortcut = QShortcut(QKeySequence("T"), self)
-        self.text_shortcut.activated.connect(lambda: self.select_format('text'))
-        
-        # P for PDF
-        self.pdf_shortcut = QShortcut(QKeySequence("P"), self)
-        self.pdf_shortcut.activated.connect(lambda: self.select_format('pdf'))
-        
-        # Enter/Return to select default (text)
-        self.enter_shortcut = QShortcut(QKeySequence(Qt.Key_Return), self)
-        self.enter_shortcut.activated.connect(lambda: self.select_format('text'))
-        
-        self.enter_shortcut2 = QShortcut(QKeySequence(Qt.Key_Enter), self)
-        self.enter_shortcut2.activated.connect(lambda: self.select_format('text'))
-    
     def select_format(self, format_type):
         """Handle format selection"""
         self.formatSelected.emit(format_type)
         self.accept()
     
     def keyPressEvent(self, event):
-        """Handle key press events for button navigation"""
-        # Enter/Space activates the text button
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
-            self.select_format('text')
+        """Handle key press events for format selection and cancel"""
+        # Leave modified keys (Ctrl+P, Alt+T, ...) to the default handling
+        if event.modifiers() & (Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier):
+            super().keyPressEvent(event)
+            return
+        
+        action = self._KEY_ACTIONS.get(event.key())
+        if action == 'cancel':
+            self.reject()
+            event.accept()
+            return
+        if action:
+            self.select_format(action)
             event.accept()
             return
             
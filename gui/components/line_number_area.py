@@ -1,7 +1,10 @@
 # gui/components/line_number_area.py
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QTextFormat
-from PySide6.QtCore import QSize, QRect, Qt
+from PySide6.QtCore import QSize, QRect, QPoint, Qt, QEvent
+
+# Line number strings kept between paints, a few screens' worth
+_MAX_CACHED_NUMBERS = 1024
 
 class LineNumberArea(QWidget):
     """Widget that displays line numbers next to a QTextEdit"""
@@ -9,18 +12,33 @@ class LineNumberArea(QWidget):
     def __init__(self, text_edit):
         super().__init__(text_edit)
         self.text_edit = text_edit
-        self.text_edit.document().blockCountChanged.connect(self.update_width)
-        self.text_edit.document().documentLayoutChanged.connect(self.update)
+        # Line number strings reused across paints, keyed by 1-based line number
+        self._number_strings = {}
+        # Width of a digit in our font and the digit count the width was last set for
+        self._nine_adv = self.fontMetrics().horizontalAdvance('9')
+        self._last_digits = 0
+        self.text_edit.document().blockCountChanged.connect(self._on_block_count_changed)
+        # Repaint only the lines an edit touches; size changes shift every line below
+        self._block_count = self.text_edit.document().blockCount()
+        self.text_edit.document().contentsChange.connect(self._on_contents_change)
+        self.text_edit.document().documentLayout().documentSizeChanged.connect(self.update)
         self.text_edit.verticalScrollBar().valueChanged.connect(self.update)
         
         # Set initial width
         self.update_width()
     
-    def update_width(self):
-        """Update the width of the line number area"""
+    def update_width(self, force=False):
+        """Update the width of the line number area
+        
+        Args:
+            force: Recompute even if the number of digits hasn't changed
+        """
         # Calculate width based on number of digits in line count
         digits = len(str(max(1, self.text_edit.document().blockCount())))
-        width = self.fontMetrics().horizontalAdvance('9') * max(2, digits + 1)
+        if digits == self._last_digits and not force:
+            return
+        self._last_digits = digits
+        width = self._nine_adv * max(2, digits + 1)
         
         # Set fixed width
         self.setFixedWidth(width)
@@ -29,6 +47,10 @@ class LineNumberArea(QWidget):
         rect = self.text_edit.contentsRect()
         self.text_edit.setViewportMargins(width if self.isVisible() else 0, 0, 0, 0)
     
+    def _on_block_count_changed(self, block_count):
+        """Resize for the new line count (the count itself is re-read in update_width)"""
+        self.update_width()
+    
     def paintEvent(self, event):
         """Paint the line numbers"""
         if not self.isVisible():
@@ -56,28 +78,73 @@ class LineNumberArea(QWidget):
             font.setPointSize(self.text_edit.font().pointSize())
         painter.setFont(font)
         
-        # Get and draw each line number
-        block = self.text_edit.document().begin()
-        line_count = 1
+        # Start from the first block in the viewport instead of the document start
+        block = self.text_edit.cursorForPosition(QPoint(0, 0)).block()
+        line_count = block.blockNumber() + 1
         line_height = self.fontMetrics().height()
         
+        # One rectangle moved down for each line instead of a new one per drawText
+        number_rect = QRect(0, 0, self.width() - 5, line_height)
+        layout = self.text_edit.document().documentLayout()
+        
         while block.isValid():
-            position = self.text_edit.document().documentLayout().blockBoundingRect(block).topLeft()
-            top = position.y() - viewport_offset
-            
-            # Only paint visible blocks
-            if top >= 0 and top <= viewport_height:
-                number = str(line_count)
-                painter.drawText(0, int(top), self.width() - 5, line_height,
-                                Qt.AlignRight, number)
+            top = layout.blockBoundingRect(block).top() - viewport_offset
             
             # Stop if we're beyond viewport
             if top > viewport_height:
                 break
+            
+            # Only paint visible blocks
+            if top >= 0:
+                number_rect.moveTop(int(top))
+                painter.drawText(number_rect, Qt.AlignRight, self._number_string(line_count))
                 
             block = block.next()
             line_count += 1
     
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Repaint the line numbers next to the blocks affected by an edit"""
+        document = self.text_edit.document()
+        
+        # Added or removed lines renumber everything below them
+        block_count = document.blockCount()
+        if block_count != self._block_count:
+            self._block_count = block_count
+            self.update()
+            return
+        
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + chars_added)
+        if not first_block.isValid():
+            self.update()
+            return
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+        
+        layout = document.documentLayout()
+        viewport_offset = self.text_edit.verticalScrollBar().value()
+        top = layout.blockBoundingRect(first_block).top() - viewport_offset
+        bottom = layout.blockBoundingRect(last_block).bottom() - viewport_offset
+        self.update(0, int(top), self.width(), int(bottom - top) + 1)
+    
+    def _number_string(self, line_number):
+        """Return the cached display string for a 1-based line number"""
+        numbers = self._number_strings
+        text = numbers.get(line_number)
+        if text is None:
+            # Only painted lines are cached; start over once scrolling has filled it
+            if len(numbers) >= _MAX_CACHED_NUMBERS:
+                numbers.clear()
+            text = numbers[line_number] = str(line_number)
+        return text
+    
+    def changeEvent(self, event):
+        """Refresh the cached digit width when our font changes"""
+        if event.type() == QEvent.FontChange:
+            self._nine_adv = self.fontMetrics().horizontalAdvance('9')
+            self.update_width(force=True)
+        super().changeEvent(event)
+    
     def sizeHint(self):
         """Return the recommended size for the widget"""
         return QSize(self.width(), 0)
@@ -88,7 +155,7 @@ class LineNumberArea(QWidget):
         
         # Update margin when visibility changes
         if visible:
-            self.update_width()
+            self.update_width(force=True)
         else:
             self.text_edit.setViewportMargins(0, 0, 0, 0)
             
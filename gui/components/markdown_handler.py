@@ -1,6 +1,12 @@
 # gui/components/markdown_handler.py
+import weakref
+
 from PySide6.QtGui import QTextDocument
 
+# Fingerprint of the last markdown loaded into each document, along with the
+# document state right after loading, so reloading unchanged text is skipped
+_last_conversion = weakref.WeakKeyDictionary()
+
 class MarkdownHandler:
     """
     Utility class for handling Markdown conversion for text editors
@@ -9,6 +15,9 @@ class MarkdownHandler:
     without replacing the existing text editor.
     """
     
+    # File extensions recognised as Markdown
+    _MD_EXTS = ('.md', '.markdown', '.mdown', '.mdwn')
+    
     def markdown_to_rich_text(document, markdown_text):
         """
         Convert Markdown to rich text and load it into a QTextDocument
@@ -18,7 +27,13 @@ class MarkdownHandler:
             markdown_text: The Markdown text to convert
         """
         from PySide6.QtGui import QTextCursor, QTextBlockFormat, QTextCharFormat, QFont
-        from PySide6.QtCore import Qt
+        from PySide6.QtCore import Qt, QRegularExpression
+        
+        # Nothing to do if this exact text is already loaded and unedited
+        fingerprint = (hash(markdown_text), len(markdown_text))
+        cached = _last_conversion.get(document)
+        if cached and cached == (fingerprint, document.revision(), document.characterCount()):
+            return
         
         # First convert normally
         document.setMarkdown(
@@ -26,33 +41,38 @@ class MarkdownHandler:
             QTextDocument.MarkdownFeature.MarkdownDialectGitHub
         )
         
-        # Find and style PAGE BREAK lines
+        # Center the PAGE BREAK blocks and make them bold, letting Qt skip the other blocks
         cursor = QTextCursor(document)
         cursor.beginEditBlock()
         
-        block = document.begin()
-        while block.isValid():
-            text = block.text()
-            if text.startswith('PAGE BREAK '):
-                # Move cursor to this block
-                cursor.setPosition(block.position())
-                
-                # Set block format for centering and borders
-                block_format = QTextBlockFormat()
-                block_format.setAlignment(Qt.AlignCenter)
-                block_format.setTopMargin(5)
-                block_format.setBottomMargin(20)
-                cursor.setBlockFormat(block_format)
-                
-                # Select all text in the block and make it bold
-                cursor.select(QTextCursor.BlockUnderCursor)
-                char_format = QTextCharFormat()
-                char_format.setFontWeight(QFont.Bold)
-                cursor.setCharFormat(char_format)
+        # Set block format for centering and borders
+        block_format = QTextBlockFormat()
+        block_format.setAlignment(Qt.AlignCenter)
+        block_format.setTopMargin(5)
+        block_format.setBottomMargin(20)
+        
+        char_format = QTextCharFormat()
+        char_format.setFontWeight(QFont.Bold)
+        
+        pattern = QRegularExpression(r"^PAGE BREAK ")
+        match_cursor = document.find(pattern, 0)
+        while not match_cursor.isNull():
+            block = match_cursor.block()
+            
+            # Move cursor to this block
+            cursor.setPosition(block.position())
+            cursor.setBlockFormat(block_format)
             
-            block = block.next()
+            # Select the text of the block and make it bold
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+            cursor.mergeCharFormat(char_format)
+            
+            # Continue the search from the start of the next block
+            match_cursor = document.find(pattern, block.position() + block.length())
         
         cursor.endEditBlock()
+        
+        _last_conversion[document] = (fingerprint, document.revision(), document.characterCount())
 
     @staticmethod
     def rich_text_to_markdown(document):
@@ -83,5 +103,4 @@ class MarkdownHandler:
         if not filepath:
             return False
             
-        markdown_extensions = ['.md', '.markdown', '.mdown', '.mdwn']
-        return any(filepath.lower().endswith(ext) for ext in markdown_extensions)
+        return filepath.lower().endswith(MarkdownHandler._MD_EXTS)
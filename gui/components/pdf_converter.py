@@ -1,7 +1,10 @@
 # gui/components/pdf_converter.py
 import docker
+import io
 import os
 import shutil
+import tarfile
+import time
 from pathlib import Path
 
 class PDFConverter:
@@ -9,28 +12,115 @@ class PDFConverter:
     Simple class for converting markdown documents to PDF using Docker
     """
     
+    # Whether the md2pdf image is known to be present locally; shared by all
+    # instances since a new converter is created for every export
+    _image_ready = False
+    
+    # Long-lived md2pdf container reused across conversions
+    _container = None
+    _container_name = "assistivox-md2pdf"
+    _stop_on_quit = False  # Whether stop_container is connected to aboutToQuit
+    
+    # Docker client shared by all converters, and the time (time.monotonic)
+    # until which the last successful daemon ping is trusted
+    _docker_client = None
+    _docker_ok_until = 0.0
+    _DOCKER_OK_TTL = 5.0
+    
     def __init__(self):
         """Initialize the PDF converter"""
-        try:
-            self.docker_client = docker.from_env()
-            self.docker_image = 'jmaupetit/md2pdf'
-        except Exception as e:
-            print(f"Docker initialization error: {e}")
-            self.docker_client = None
+        self.docker_image = 'jmaupetit/md2pdf'
+        if PDFConverter._docker_client is None:
+            try:
+                PDFConverter._docker_client = docker.from_env()
+            except Exception as e:
+                print(f"Docker initialization error: {e}")
+        self.docker_client = PDFConverter._docker_client
         
     def is_docker_available(self):
         """Check if Docker is available and running"""
         if not self.docker_client:
             return False
+        now = time.monotonic()
+        if now < PDFConverter._docker_ok_until:
+            return True
         try:
             self.docker_client.ping()
+            PDFConverter._docker_ok_until = now + PDFConverter._DOCKER_OK_TTL
             return True
         except Exception:
+            PDFConverter._docker_ok_until = 0.0
             return False
     
+    def _ensure_image(self):
+        """Make sure the md2pdf image is present, pulling it only when missing"""
+        if PDFConverter._image_ready:
+            return
+        try:
+            self.docker_client.images.get(self.docker_image)
+        except docker.errors.ImageNotFound:
+            try:
+                self.docker_client.images.pull(self.docker_image)
+            except Exception as e:
+                print(f"Warning: Could not pull Docker image: {e}")
+                return
+        except Exception as e:
+            print(f"Warning: Could not check Docker image: {e}")
+            return
+        PDFConverter._image_ready = True
+    
+    def _get_container(self):
+        """Return the running md2pdf container, starting it on first use"""
+        container = PDFConverter._container
+        if container is not None:
+            try:
+                container.reload()
+                if container.status == 'running':
+                    return container
+            except Exception:
+                pass  # Container went away; start a new one
+            PDFConverter._container = None
+        
+        # Remove any leftover container with the same name
+        try:
+            self.docker_client.containers.get(self._container_name).remove(force=True)
+        except docker.errors.NotFound:
+            pass
+        
+        # Keep the container idle and run md2pdf in it for each conversion
+        container = self.docker_client.containers.run(
+            image=self.docker_image,
+            entrypoint=['sleep', 'infinity'],
+            name=self._container_name,
+            working_dir='/app',
+            detach=True,
+            auto_remove=True
+        )
+        PDFConverter._container = container
+        
+        # Stop the container together with the application
+        from PySide6.QtCore import QCoreApplication
+        app = QCoreApplication.instance()
+        if app and not PDFConverter._stop_on_quit:
+            app.aboutToQuit.connect(PDFConverter.stop_container)
+            PDFConverter._stop_on_quit = True
+        
+        return container
+    
+    @classmethod
+    def stop_container(cls):
+        """Stop the shared md2pdf container (it is removed automatically)"""
+        if cls._container is None:
+            return
+        try:
+            cls._container.stop(timeout=1)
+        except Exception as e:
+            print(f"Error stopping md2pdf container: {e}")
+        cls._container = None
+    
     def convert_markdown_to_pdf(self, markdown_content, output_pdf_path):
         """
-        Convert markdown content to PDF file using cache directory
+        Convert markdown content to PDF file inside the md2pdf container
         
         Args:
             markdown_content (str): The markdown content to convert
@@ -44,54 +134,42 @@ class PDFConverter:
                 raise Exception("Docker client not available")
             
             # Pull image if needed
-            try:
-                self.docker_client.images.pull(self.docker_image)
-            except Exception as e:
-                print(f"Warning: Could not pull Docker image: {e}")
+            self._ensure_image()
+            container = self._get_container()
             
-            # Create cache directory
-            cache_dir = Path.home() / ".assistivox" / "cache"
-            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Send the markdown into the container as an in-memory tar archive
+            markdown_bytes = markdown_content.encode('utf-8')
+            tar_buffer = io.BytesIO()
+            with tarfile.open(fileobj=tar_buffer, mode='w') as tar:
+                info = tarfile.TarInfo('temp_document.md')
+                info.size = len(markdown_bytes)
+                info.mtime = int(time.time())
+                tar.addfile(info, io.BytesIO(markdown_bytes))
+            container.put_archive('/app', tar_buffer.getvalue())
             
-            # Write markdown to cache
-            temp_md_file = cache_dir / "temp_document.md"
-            with open(temp_md_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            print(f"Wrote markdown to: {temp_md_file}")
-            
-            # Run Docker with cache directory mounted
+            # Run md2pdf in the warm container, dropping any PDF from a previous export
             print("Running Docker conversion...")
-            result = self.docker_client.containers.run(
-                image=self.docker_image,
-                command=['temp_document.md', 'temp_document.pdf'],
-                volumes={str(cache_dir): {'bind': '/app', 'mode': 'rw'}},
-                working_dir='/app',
-                remove=True,
-                stdout=True,
-                stderr=True
+            exit_code, result = container.exec_run(
+                ['sh', '-c', 'rm -f temp_document.pdf && md2pdf temp_document.md temp_document.pdf'],
+                workdir='/app'
             )
             
             print(f"Docker output: {result.decode('utf-8') if result else 'No output'}")
+            if exit_code != 0:
+                print(f"PDF file was not created by Docker (md2pdf exited with code {exit_code})")
+                return False
             
-            # Check if PDF was created
-            temp_pdf_file = cache_dir / "temp_document.pdf"
-            if temp_pdf_file.exists():
-                # Copy to final destination
+            # Read the PDF back as a tar stream and write it to the final destination
+            stream, _ = container.get_archive('/app/temp_document.pdf')
+            with tarfile.open(fileobj=io.BytesIO(b''.join(stream))) as tar:
+                pdf_file = tar.extractfile(tar.next())
                 output_path = Path(output_pdf_path)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(temp_pdf_file, output_path)
-                
-                print(f"PDF successfully created: {output_pdf_path}")
-                
-                # Clean up temp files
-                temp_md_file.unlink(missing_ok=True)
-                temp_pdf_file.unlink(missing_ok=True)
-                
-                return True
-            else:
-                print("PDF file was not created by Docker")
-                return False
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(pdf_file, f)
+            
+            print(f"PDF successfully created: {output_pdf_path}")
+            return True
                 
         except Exception as e:
             print(f"Error converting markdown to PDF: {e}")
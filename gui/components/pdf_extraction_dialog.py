@@ -2,11 +2,31 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QWidget, QProgressBar
 )
-from PySide6.QtCore import Qt, QProcess, Signal
+from PySide6.QtCore import Qt, QProcess, QTimer, Signal
 from PySide6.QtGui import QShortcut, QKeySequence, QFont
 import sys
 import tempfile
+import shutil
 import os
+from collections import OrderedDict
+
+from gui.components._pdf_extract_worker import PROGRESS_RECORD, MSG_TOTAL_PAGES, MSG_PAGE_COMPLETE
+
+# Directory containing the gui package, used to launch the extraction worker
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Recent extraction results keyed by PDF identity and page range, most recent last
+_extraction_cache = OrderedDict()
+_EXTRACTION_CACHE_SIZE = 16
+
+
+def _extraction_cache_key(pdf_path, start_page, end_page):
+    """Return a key that changes whenever the PDF file is modified, or None if it can't be read"""
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return None
+    return (os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size, start_page, end_page)
 
 
 class PDFExtractionDialog(QDialog):
@@ -18,6 +38,8 @@ class PDFExtractionDialog(QDialog):
         self.extraction_process = None
         self.extracted_text = ""
         self.temp_output_file = None
+        self._tmpdir = None
+        self._cache_key = None
         self.is_cancelling = False  # Track if we're intentionally cancelling
         self.setup_ui()
         self.setup_connections()
@@ -84,101 +106,33 @@ class PDFExtractionDialog(QDialog):
         self.escape_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
         self.escape_shortcut.activated.connect(self.cancel_extraction)
         
+        # Apply progress to the widgets at most ~30 times a second while extracting
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(33)
+        self._ui_timer.timeout.connect(self._flush_ui)
+        
     def start_extraction(self):
         """Start the PDF extraction process using external Python process"""
-        # Create temporary file for output
-        self.temp_output_file = tempfile.mktemp(suffix='.md')
-
         # Get page range from dialog if available
         start_page = getattr(self, 'start_page', 1)
         end_page = getattr(self, 'end_page', None)
         
-        # Create extraction script content with progress reporting
-        script_content = f'''
-import sys
-import tempfile
-
-try:
-    from pypdf import PdfReader
-    from docling.document_converter import DocumentConverter
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
-    from docling.document_converter import PdfFormatOption
-    
-    # Get PDF page count using pypdf
-    reader = PdfReader("{self.pdf_path}")
-    num_pages = len(reader.pages)
-    
-    start_page = {start_page}
-    end_page = {end_page if end_page else 'num_pages'}
-    
-    # Use page range or full document
-    if end_page == 'num_pages':
-        end_page = num_pages
-        
-    # Ensure valid range
-    start_page = max(1, min(start_page, num_pages))
-    end_page = max(start_page, min(end_page, num_pages))
-
-    page_count = end_page - start_page + 1
-
-    # Report total pages in range
-    print(f"TOTAL_PAGES:{{page_count}}")
-    sys.stdout.flush()
-
-    # Set up pipeline options
-    pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = True
-    pipeline_options.do_table_structure = True
-    pipeline_options.table_structure_options.do_cell_matching = True
-    
-    # Create converter with pipeline options
-    doc_converter = DocumentConverter(
-        format_options={{
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }}
-    )
-    
-    # Extract each page separately and build ASVX content
-    asvx_parts = []
-    
-    for page_num in range(start_page, end_page + 1):  # Docling is 1-indexed
-        # Add ASVX page tag with actual PDF page number
-        asvx_parts.append("{{"+f"asvx|page|num:{{page_num}}"+"}}\\n\\n")
-        
-        result = doc_converter.convert("{self.pdf_path}", page_range=(page_num, page_num))
-        md_text = result.document.export_to_markdown()
-        
-        # Add the page content
-        asvx_parts.append(md_text)
+        # Reuse the result of an earlier extraction of the same unchanged file
+        self._cache_key = _extraction_cache_key(self.pdf_path, start_page, end_page)
+        cached_text = _extraction_cache.get(self._cache_key) if self._cache_key else None
+        if cached_text is not None:
+            _extraction_cache.move_to_end(self._cache_key)
+            self.extracted_text = cached_text
+            self.status_label.setText("Extraction complete!")
+            # Accept once the caller's event loop is running
+            QTimer.singleShot(0, self.accept)
+            return
         
-        # Add spacing between pages (except for the last page)
-        if page_num < end_page:
-            asvx_parts.append("\\n\\n")
+        # Create temporary file for output in a private directory removed as a whole
+        self._tmpdir = tempfile.mkdtemp(prefix='asvx_pdf_')
+        with tempfile.NamedTemporaryFile(delete=False, dir=self._tmpdir, suffix='.md') as f:
+            self.temp_output_file = f.name
         
-        # Report progress after each page
-        print(f"PAGE_COMPLETE:{{page_num - start_page + 1}}")
-        sys.stdout.flush()
-    
-    # Combine all parts into final ASVX content
-    final_asvx = "".join(asvx_parts)
-    
-    # Write result to temp file
-    with open("{self.temp_output_file}", "w", encoding="utf-8") as f:
-        f.write(final_asvx)
-    
-    print("SUCCESS")
-    
-except Exception as e:
-    print(f"ERROR: {{str(e)}}")
-    sys.exit(1)
-'''
-
-        # Write script to temporary file
-        self.temp_script_file = tempfile.mktemp(suffix='.py')
-        with open(self.temp_script_file, 'w', encoding='utf-8') as f:
-            f.write(script_content)
-    
         # Create and start process
         self.extraction_process = QProcess(self)
         self.extraction_process.finished.connect(self.on_process_finished)
@@ -188,16 +142,27 @@ except Exception as e:
         # Initialize progress tracking
         self.total_pages = 0
         self.completed_pages = 0
+        self._stdout_buf = bytearray()
+        self._shown_total = 0
+        self._shown_page = 0
         
         # Start the process
-        self.extraction_process.start(sys.executable, [self.temp_script_file])
+        # The worker is a regular module, so it is run from the project root
+        self.extraction_process.setWorkingDirectory(_PROJECT_ROOT)
+        self.extraction_process.start(sys.executable, [
+            '-m', 'gui.components._pdf_extract_worker',
+            self.pdf_path, str(start_page), str(end_page or -1), self.temp_output_file
+        ])
         self.status_label.setText("Starting extraction...")
         
         # Show progress bar
         self.progress_widget.setVisible(True)
+        self._ui_timer.start()
 
     def on_process_finished(self, exit_code, exit_status):
         """Handle process completion"""
+        self._ui_timer.stop()
+        
         # If we're cancelling, don't show error messages
         if self.is_cancelling:
             return
@@ -208,6 +173,11 @@ except Exception as e:
                 with open(self.temp_output_file, 'r', encoding='utf-8') as f:
                     self.extracted_text = f.read()
                 
+                if self._cache_key:
+                    _extraction_cache[self._cache_key] = self.extracted_text
+                    if len(_extraction_cache) > _EXTRACTION_CACHE_SIZE:
+                        _extraction_cache.popitem(last=False)
+                
                 self.status_label.setText("Extraction complete!")
                 
                 # Clean up temp files
@@ -249,6 +219,7 @@ except Exception as e:
         """Cancel the extraction process"""
         # Set cancelling flag to prevent error dialogs
         self.is_cancelling = True
+        self._ui_timer.stop()
 
         # Hide progress bar
         self.progress_widget.setVisible(False)
@@ -268,17 +239,11 @@ except Exception as e:
     
     def cleanup_temp_files(self):
         """Clean up temporary files"""
-        if hasattr(self, 'temp_output_file') and self.temp_output_file and os.path.exists(self.temp_output_file):
-            try:
-                os.unlink(self.temp_output_file)
-            except:
-                pass
-                
-        if hasattr(self, 'temp_script_file') and self.temp_script_file and os.path.exists(self.temp_script_file):
-            try:
-                os.unlink(self.temp_script_file)
-            except:
-                pass
+        # Cleanup runs from several exit paths, only remove the directory once
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+            self.temp_output_file = None
     
     def get_extracted_text(self):
         """Get the extracted text"""
@@ -304,28 +269,33 @@ except Exception as e:
         if not self.extraction_process:
             return
             
-        data = self.extraction_process.readAllStandardOutput()
-        output = bytes(data).decode('utf-8')
+        # Accumulate raw bytes; a read may end partway through a record
+        self._stdout_buf += bytes(self.extraction_process.readAllStandardOutput())
         
-        for line in output.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('TOTAL_PAGES:'):
-                try:
-                    self.total_pages = int(line.split(':')[1])
-                    self.progress_bar.setRange(0, self.total_pages)
-                    self.progress_label.setText(f"0 of {self.total_pages} pages")
-                except ValueError:
-                    pass
-                    
-            elif line.startswith('PAGE_COMPLETE:'):
-                try:
-                    page_num = int(line.split(':')[1])
-                    self.completed_pages = page_num
-                    self.progress_bar.setValue(page_num)
-                    self.progress_label.setText(f"{page_num} of {self.total_pages} pages")
-                    self.status_label.setText(f"Processing page {page_num} of {self.total_pages}...")
-                except ValueError:
-                    pass
+        record_size = PROGRESS_RECORD.size
+        consumed = 0
+        while len(self._stdout_buf) - consumed >= record_size:
+            msg, value = PROGRESS_RECORD.unpack_from(self._stdout_buf, consumed)
+            consumed += record_size
+            
+            # Only record the latest values; _flush_ui updates the widgets
+            if msg == MSG_PAGE_COMPLETE:
+                self.completed_pages = value
+            elif msg == MSG_TOTAL_PAGES:
+                self.total_pages = value
+        
+        del self._stdout_buf[:consumed]
+    
+    def _flush_ui(self):
+        """Show the most recent progress if it changed since the last tick"""
+        if self.total_pages != self._shown_total:
+            self._shown_total = self.total_pages
+            self.progress_bar.setRange(0, self.total_pages)
+            if not self.completed_pages:
+                self.progress_label.setText(f"0 of {self.total_pages} pages")
+        
+        if self.completed_pages != self._shown_page:
+            page_num = self._shown_page = self.completed_pages
+            self.progress_bar.setValue(page_num)
+            self.progress_label.setText(f"{page_num} of {self.total_pages} pages")
+            self.status_label.setText(f"Processing page {page_num} of {self.total_pages}...")
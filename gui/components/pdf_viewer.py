@@ -0,0 +1,461 @@
+# gui/components/pdf_viewer.py
+"""
+Viewer window for original PDF documents
+
+Kept apart from pdf_handler so that QtPdf is only loaded when a PDF is
+actually displayed, not whenever a file is checked or converted.
+"""
+import os
+from PySide6.QtWidgets import (
+        QMainWindow, QVBoxLayout, QWidget, QLabel, QStatusBar, QDialog,
+        QHBoxLayout, QLineEdit, QPushButton, QProgressBar
+)
+from PySide6.QtPdfWidgets import QPdfView
+from PySide6.QtPdf import QPdfDocument
+from PySide6.QtCore import Qt, QPointF, QTimer, Signal
+from PySide6.QtGui import QShortcut, QKeySequence
+
+# Debug output for document loading and TTS hand-off, off unless ASSISTIVOX_DEBUG=1
+_DEBUG = os.environ.get('ASSISTIVOX_DEBUG') == '1'
+
+
+class PageNavigationDialog(QDialog):
+    """Dialog for entering a page number to navigate to"""
+
+    def __init__(self, total_pages, current_page=1, parent=None):
+        super().__init__(parent)
+        self.total_pages = total_pages
+        self.setWindowTitle("Go to Page")
+        self.setModal(True)
+        self.resize(300, 120)
+
+        # Create layout
+        layout = QVBoxLayout(self)
+
+        # Instructions
+        self.instruction_label = QLabel(f"Enter page number (1-{total_pages}):")
+        layout.addWidget(self.instruction_label)
+
+        # Page input
+        input_layout = QHBoxLayout()
+        self.page_input = QLineEdit()
+        self.page_input.setText(str(current_page))
+        self.page_input.selectAll()  # Select all text for easy replacement
+        input_layout.addWidget(QLabel("Page:"))
+        input_layout.addWidget(self.page_input)
+        layout.addLayout(input_layout)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        self.ok_button = QPushButton("OK")
+        self.cancel_button = QPushButton("Cancel")
+
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
+
+        # Set OK as default button and connect Enter key
+        self.ok_button.setDefault(True)
+        self.page_input.returnPressed.connect(self.accept)
+
+        # Focus on input field
+        self.page_input.setFocus()
+
+    def reset(self, total_pages, current_page):
+        """Prepare the dialog to be shown again for a new page count and position"""
+        self.total_pages = total_pages
+        self.instruction_label.setText(f"Enter page number (1-{total_pages}):")
+        self.page_input.setText(str(current_page))
+        self.page_input.selectAll()
+        self.page_input.setFocus()
+
+    def get_page_number(self):
+        """Get the entered page number, returns None if invalid"""
+        try:
+            page_num = int(self.page_input.text().strip())
+            if 1 <= page_num <= self.total_pages:
+                return page_num
+            return None
+        except ValueError:
+            return None
+
+
+class PDFViewerWindow(QMainWindow):
+    """
+    Independent window for viewing original PDF documents with zoom controls
+    """
+
+    def __init__(self, pdf_path, parent=None):
+        super().__init__(parent)
+
+        # Store parent reference separately to avoid conflict with parent() method
+        self.parent_editor = parent
+
+        # Set window flags to make it independent but still associated with the main app
+        # Remove WindowStaysOnTopHint to allow natural focus switching
+        self.setWindowFlags(Qt.Window)
+
+        # Set up window properties
+        self.setWindowTitle(f"PDF Viewer - {os.path.basename(pdf_path)}")
+        self.resize(800, 600)
+    
+        # Initialize zoom factor
+        self.zoom_factor = 1.0  # 100%
+        
+        # Zoom changes made in one event-loop pass are applied to the view once
+        self._zoom_mode_is_custom = False
+        self._pending_zoom_timer = QTimer(self)
+        self._pending_zoom_timer.setSingleShot(True)
+        self._pending_zoom_timer.setInterval(0)
+        self._pending_zoom_timer.timeout.connect(self._flush_zoom)
+    
+        # Initialize page tracking
+        self.current_page = 1
+        self.total_pages = 0
+        self._goto_dialog = None
+        self._pending_page = None  # Page requested before the document finished loading
+    
+        # Create central widget and layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create PDF view
+        self.pdf_view = PDFView()  # Using our custom PDFView subclass
+        self.pdf_view.wheelZoomRequested.connect(self.handle_wheel_zoom)
+        layout.addWidget(self.pdf_view)
+
+        # Create PDF document
+        self.pdf_document = QPdfDocument()
+        self.pdf_view.setDocument(self.pdf_document)
+
+        # Set zoom mode to fit width by default
+        self.pdf_view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
+        self.pdf_view.setPageMode(QPdfView.PageMode.MultiPage)  # Enable scrolling through multiple pages
+    
+        # Create enhanced status bar
+        self.create_status_bar()
+    
+        # Add keyboard shortcuts
+        self.add_shortcuts()
+        self._build_keymap()
+    
+        # Connect signals for page tracking before loading; load() can report
+        # Ready and the page count before it returns
+        self.setup_page_tracking()
+    
+        # Load the PDF file
+        self.pdf_document.load(pdf_path)
+
+    def handle_wheel_zoom(self, delta):
+        """Handle zoom requests from wheel events"""
+        if delta > 0:
+            self.zoom_in()
+        else:
+            self.zoom_out()
+    
+    def zoom_in_status(self):
+        """Increase zoom factor from status bar button"""
+        self.zoom_in()
+
+    def zoom_out_status(self):
+        """Decrease zoom factor from status bar button"""
+        self.zoom_out()
+
+    def zoom_in(self):
+        """Increase zoom factor"""
+        self._adjust_zoom(1)
+
+    def zoom_out(self):
+        """Decrease zoom factor"""
+        self._adjust_zoom(-1)
+
+    def _adjust_zoom(self, direction):
+        """Scale the zoom by 1.2 in the given direction, clamped to 20%-500%"""
+        factor = self.zoom_factor * (1.2 if direction > 0 else 1 / 1.2)
+        self.zoom_factor = min(max(factor, 0.2), 5.0)
+        self.apply_zoom()
+
+    def zoom_reset(self):
+        """Reset zoom to 100%"""
+        self.zoom_factor = 1.0
+        self.apply_zoom()
+    
+    def apply_zoom(self):
+        """Schedule the current zoom factor to be applied to the PDF view"""
+        self._pending_zoom_timer.start()
+
+    def _flush_zoom(self):
+        """Apply the latest zoom factor to the PDF view"""
+        # Switch to custom zoom mode the first time only
+        if not self._zoom_mode_is_custom:
+            self.pdf_view.setZoomMode(QPdfView.ZoomMode.Custom)
+            self._zoom_mode_is_custom = True
+        self.pdf_view.setZoomFactor(self.zoom_factor)
+        
+        # Update zoom indicator
+        zoom_percentage = int(self.zoom_factor * 100)
+        self.zoom_label.setText(f"Zoom: {zoom_percentage}%")
+
+    def keyPressEvent(self, event):
+        """Handle key press events for the PDF viewer window"""
+        ctrl = bool(event.modifiers() & Qt.ControlModifier)
+        handler = self._keymap.get((event.key(), ctrl))
+        if handler:
+            handler()
+        else:
+            # Pass other key events to parent
+            super().keyPressEvent(event)
+
+    def _build_keymap(self):
+        """Map (key, Ctrl pressed) to the page navigation handlers"""
+        self._keymap = {
+            # Close the window when Escape is pressed
+            (Qt.Key_Escape, False): self.close,
+            (Qt.Key_Escape, True): self.close,
+            (Qt.Key_PageDown, False): self._next_page,
+            (Qt.Key_PageDown, True): self._next_page,
+            (Qt.Key_PageUp, False): self._prev_page,
+            (Qt.Key_PageUp, True): self._prev_page,
+            (Qt.Key_Home, True): self._first_page,
+            (Qt.Key_End, True): self._last_page,
+        }
+
+    def _next_page(self):
+        """Move to next page"""
+        # current_page is tracked from currentPageChanged, 1-based
+        if self.current_page < self.total_pages:
+            self.pdf_view.pageNavigator().jump(self.current_page, QPointF(0, 0))
+
+    def _prev_page(self):
+        """Move to previous page"""
+        if self.current_page > 1:
+            self.pdf_view.pageNavigator().jump(self.current_page - 2, QPointF(0, 0))
+
+    def _first_page(self):
+        """Go to first page"""
+        self.pdf_view.pageNavigator().jump(0, QPointF(0, 0))
+
+    def _last_page(self):
+        """Go to last page"""
+        # Page count is tracked from document signals rather than queried per key
+        if self.total_pages > 0:
+            self.pdf_view.pageNavigator().jump(self.total_pages - 1, QPointF(0, 0))
+
+    def create_status_bar(self):
+        """Create the enhanced status bar with page info, zoom controls, and progress bar"""
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+    
+        # Create status bar widgets
+        status_layout = QHBoxLayout()
+        status_widget = QWidget()
+        status_widget.setLayout(status_layout)
+    
+        # Page info (clickable button)
+        self.page_info_button = QPushButton("0 / 0")
+        self.page_info_button.setFlat(True)  # Make it look less button-like but still clickable
+        self.page_info_button.clicked.connect(self.show_go_to_page_dialog)
+        status_layout.addWidget(self.page_info_button)
+    
+        status_layout.addStretch()  # Push zoom controls to the right
+    
+        # Zoom controls
+        self.zoom_label = QLabel("Zoom: 100%")
+        status_layout.addWidget(self.zoom_label)
+
+        self.zoom_out_button = QPushButton("-")
+        self.zoom_out_button.setMaximumWidth(30)
+        self.zoom_out_button.clicked.connect(self.zoom_out_status)
+        status_layout.addWidget(self.zoom_out_button)
+
+        self.zoom_in_button = QPushButton("+")
+        self.zoom_in_button.setMaximumWidth(30)
+        self.zoom_in_button.clicked.connect(self.zoom_in_status)
+        status_layout.addWidget(self.zoom_in_button)
+
+        status_layout.addStretch()  # Push progress bar to the right
+    
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setMinimum(1)
+        self.progress_bar.setMaximum(1)  # Will be updated when document loads
+        self.progress_bar.setValue(1)
+        status_layout.addWidget(self.progress_bar)
+    
+        # Add the status widget to the status bar
+        self.status_bar.addPermanentWidget(status_widget, 1)
+
+    def add_shortcuts(self):
+        """Add keyboard shortcuts"""
+        # Alt+G for go to page
+        self.go_to_page_shortcut = QShortcut(QKeySequence("Alt+G"), self)
+        self.go_to_page_shortcut.activated.connect(self.show_go_to_page_dialog)
+    
+        # Zoom shortcuts
+        self.zoom_in_shortcut = QShortcut(QKeySequence.ZoomIn, self)
+        self.zoom_in_shortcut.activated.connect(self.zoom_in)
+    
+        self.zoom_out_shortcut = QShortcut(QKeySequence.ZoomOut, self)
+        self.zoom_out_shortcut.activated.connect(self.zoom_out)
+    
+        self.zoom_reset_shortcut = QShortcut(QKeySequence("Ctrl+0"), self)
+        self.zoom_reset_shortcut.activated.connect(self.zoom_reset)
+
+        # Alt+S for TTS from PDF
+        self.tts_shortcut = QShortcut(QKeySequence("Alt+S"), self)
+        self.tts_shortcut.activated.connect(self.start_tts_from_current_page)
+
+    def setup_page_tracking(self):
+        """Set up page tracking when document is loaded"""
+        # Connect to document status change to get total pages
+        self.pdf_document.statusChanged.connect(self.on_document_status_changed)
+        # Also pick up page counts that arrive after the Ready status
+        self.pdf_document.pageCountChanged.connect(self.on_page_count_changed)
+    
+        # Connect to page navigation changes
+        if hasattr(self.pdf_view, 'pageNavigator'):
+            nav = self.pdf_view.pageNavigator()
+            if nav:
+                # Queued so display updates run from the event loop, not inside the jump
+                nav.currentPageChanged.connect(self.on_current_page_changed, Qt.QueuedConnection)
+
+    def on_document_status_changed(self):
+        """Handle document status changes"""
+        status = self.pdf_document.status()
+        if _DEBUG:
+            print(f"Document status changed: {status}")
+    
+        if status == QPdfDocument.Status.Ready:
+            # Document is ready, get page count directly
+            self.on_page_count_changed(self.pdf_document.pageCount())
+            if _DEBUG:
+                print(f"Document ready - Total pages: {self.total_pages}")
+
+    def on_page_count_changed(self, page_count):
+        """Update the total page count and page display"""
+        if page_count <= 0 or page_count == self.total_pages:
+            return
+        
+        self.total_pages = page_count
+        self.progress_bar.setMaximum(self.total_pages)
+        
+        # Show the page the view is on now that the total is known
+        nav = self.pdf_view.pageNavigator()
+        if nav:
+            self.current_page = nav.currentPage() + 1  # Convert from 0-based to 1-based
+        self.update_page_display()
+        
+        # Make the jump that was requested while the document was loading
+        if self._pending_page is not None:
+            page_number, self._pending_page = self._pending_page, None
+            self.go_to_page(page_number)
+
+    def on_current_page_changed(self, page_index):
+        """Handle page navigation changes"""
+        new_page = page_index + 1  # Convert from 0-based to 1-based
+        if self.total_pages > 0 and new_page != self.current_page:
+            self.current_page = new_page
+            self.update_page_display()
+
+    def update_page_display(self):
+        """Update the page info display and progress bar"""
+        if self.total_pages > 0:
+            self.page_info_button.setText(f"{self.current_page} / {self.total_pages}")
+            self.progress_bar.blockSignals(True)
+            self.progress_bar.setValue(self.current_page)
+            self.progress_bar.blockSignals(False)
+
+    def show_go_to_page_dialog(self):
+        """Show the go to page dialog"""
+        # total_pages is kept current by on_page_count_changed
+        if self.total_pages <= 0:
+            if _DEBUG:
+                print(f"Cannot show dialog: total_pages={self.total_pages}")
+            return
+    
+        # Build the dialog once and refresh its fields on later uses
+        if self._goto_dialog is None:
+            self._goto_dialog = PageNavigationDialog(self.total_pages, self.current_page, self)
+        else:
+            self._goto_dialog.reset(self.total_pages, self.current_page)
+        
+        dialog = self._goto_dialog
+        if dialog.exec() == QDialog.Accepted:
+            page_number = dialog.get_page_number()
+            if page_number is not None:
+                self.go_to_page(page_number)
+            
+    def go_to_page(self, page_number):
+        """Navigate to a specific page (1-based), or once the document has loaded"""
+        if self.total_pages <= 0:
+            # Only the latest request is kept, repeated calls don't queue jumps
+            self._pending_page = page_number
+            return
+        
+        if 1 <= page_number <= self.total_pages:
+            # Convert to 0-based page number for the PDF view
+            zero_based_page = page_number - 1
+            self.pdf_view.pageNavigator().jump(zero_based_page, QPointF(0, 0))
+    
+    def start_tts_from_current_page(self):
+        """Start TTS reading from the current PDF page (Alt+S)"""
+        if not hasattr(self, 'parent_editor') or not self.parent_editor:
+            if _DEBUG:
+                print("DEBUG: No parent editor available for TTS")
+            return
+
+        current_page = self.current_page
+        if _DEBUG:
+            print(f"DEBUG: PDF Alt+S - Starting TTS from page {current_page}")
+
+        # Check if TTS window already exists
+        if hasattr(self.parent_editor, 'tts_window') and self.parent_editor.tts_window and not self.parent_editor.tts_window.isHidden():
+            # TTS window exists, bring it to front and jump to page
+            self.parent_editor.tts_window.raise_()
+            self.parent_editor.tts_window.activateWindow()
+        
+            # Jump to page if the method exists
+            if hasattr(self.parent_editor.tts_window, 'jump_to_page_and_start'):
+                self.parent_editor.tts_window.jump_to_page_and_start(current_page)
+        else:
+            # Create new TTS window using the existing toggle_speech method
+            self.parent_editor.toggle_speech()
+            
+            tts_window = getattr(self.parent_editor, 'tts_window', None)
+            if not tts_window or not hasattr(tts_window, 'jump_to_page_and_start'):
+                return
+            
+            # Jump as soon as the new window has its content and sentence data
+            if getattr(tts_window, 'is_ready', True):
+                tts_window.jump_to_page_and_start(current_page)
+            else:
+                tts_window.readyForNavigation.connect(
+                    lambda: tts_window.jump_to_page_and_start(current_page),
+                    Qt.SingleShotConnection
+                )
+
+
+class PDFView(QPdfView):
+    """Custom QPdfView that adds support for Ctrl+Wheel zooming"""
+    
+    # Signal for wheel zoom requests
+    wheelZoomRequested = Signal(int)  # Positive for zoom in, negative for zoom out
+    
+    def wheelEvent(self, event):
+        """Handle mouse wheel events for zooming when Ctrl is pressed"""
+        # Check if Ctrl key is pressed
+        if event.modifiers() & Qt.ControlModifier:
+            delta = event.angleDelta().y()
+            self.wheelZoomRequested.emit(delta)
+            event.accept()
+        else:
+            # Pass the event to the parent for normal scrolling
+            super().wheelEvent(event)
+
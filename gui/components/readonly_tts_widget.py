@@ -1,17 +1,34 @@
 # gui/components/readonly_tts_widget.py
 import os
+import re
+import bisect
+from array import array
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, 
     QLabel, QFrame, QWidget, QMainWindow
 )
 from PySide6.QtGui import (
     QFont, QTextCharFormat, QColor, QTextCursor, QKeySequence, QShortcut,
-    QTextDocument
+    QTextDocument, QTextBlockFormat
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 
 from gui.tts.tts_manager import TTSManager
 from gui.components.markdown_handler import MarkdownHandler
+from gui.nlp.sentence_detector import get_shared_detector
+
+# Debug output for clicks and navigation, off unless ASSISTIVOX_DEBUG=1
+_DEBUG = os.environ.get('ASSISTIVOX_DEBUG') == '1'
+
+# Rendered blocks longer than this are split at a word boundary, since text
+# layout time grows much faster than linearly with the length of a block
+_MAX_BLOCK_LENGTH = 4000
+
+# Markdown ATX heading line (leading/trailing whitespace already stripped)
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)')
+
+# A stripped "PAGE BREAK N" marker sentence
+_PAGE_BREAK_RE = re.compile(r'PAGE BREAK \d+\Z')
 
 
 class ReadOnlyTTSTextEdit(QTextEdit):
@@ -21,74 +38,58 @@ class ReadOnlyTTSTextEdit(QTextEdit):
         super().__init__(parent)
         self.setReadOnly(True)
         self.zoom_factor = 1.0
+        self._tts_widget = None  # Owning ReadOnlyTTSWidget, set by its setup_ui
         
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming when Ctrl is pressed"""
-        if event.modifiers() & Qt.ControlModifier:
+        tts_widget = self._tts_widget
+        if tts_widget is not None and event.modifiers() & Qt.ControlModifier:
             delta = event.angleDelta().y()
             if delta > 0:
                 # Zoom in
-                if hasattr(self.parent(), 'zoom_in'):
-                    self.parent().zoom_in()
+                tts_widget.zoom_in()
             elif delta < 0:
                 # Zoom out
-                if hasattr(self.parent(), 'zoom_out'):
-                    self.parent().zoom_out()
+                tts_widget.zoom_out()
             event.accept()
         else:
             super().wheelEvent(event)
 
     def mousePressEvent(self, event):
         """Handle mouse clicks to jump to sentences during TTS playback"""
-        print(f"DEBUG: Mouse click detected at position {event.pos()}")
+        if _DEBUG:
+            print(f"DEBUG: Mouse click detected at position {event.pos()}")
     
         # Only handle left clicks
         if event.button() != Qt.LeftButton:
             super().mousePressEvent(event)
             return
 
-        # Find the ReadOnlyTTSWidget by traversing up the parent chain
-        tts_widget = None
-        widget = self
-        while widget and not isinstance(widget, ReadOnlyTTSWidget):
-            widget = widget.parent()
-    
-        if widget and isinstance(widget, ReadOnlyTTSWidget):
-            tts_widget = widget
-    
-        print(f"DEBUG: Found TTS widget: {tts_widget is not None}")
+        # The owning ReadOnlyTTSWidget never changes after construction
+        tts_widget = self._tts_widget
     
-        if not tts_widget:
-            print("DEBUG: Could not find ReadOnlyTTSWidget in parent chain")
+        # Nothing to jump to until sentence detection has produced data
+        if tts_widget is None or tts_widget.sentence_boundary_data is None:
+            if _DEBUG:
+                print("DEBUG: No sentence data for click-to-jump")
             super().mousePressEvent(event)
             return
     
-        print(f"DEBUG: TTS manager exists: {hasattr(tts_widget, 'tts_manager') and tts_widget.tts_manager is not None}")
-    
-        if not hasattr(tts_widget, 'tts_manager') or not tts_widget.tts_manager:
-            print("DEBUG: No TTS manager on TTS widget")
+        if tts_widget.tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager on TTS widget")
             super().mousePressEvent(event)
             return
     
         tts_manager = tts_widget.tts_manager
-        print(f"DEBUG: TTS manager is_speaking: {tts_manager.is_speaking}")
-    
-        has_worker = tts_manager.tts_worker is not None
-        print(f"DEBUG: TTS manager has worker: {has_worker}")
-    
-        if has_worker:
-            worker_running = tts_manager.tts_worker.isRunning()
-            print(f"DEBUG: TTS worker is running: {worker_running}")
-        else:
-            worker_running = False
     
         # Check if TTS is active (speaking OR has active worker)
-        tts_is_active = tts_manager.is_speaking or (has_worker and worker_running)
-        print(f"DEBUG: TTS is active: {tts_is_active}")
+        tts_is_active = tts_manager.is_speaking or (
+            tts_manager.tts_worker is not None and tts_manager.tts_worker.isRunning())
+        if _DEBUG:
+            print(f"DEBUG: TTS is active: {tts_is_active}")
     
         if tts_is_active:
-            print("DEBUG: TTS is active, processing click for sentence jump")
-    
             # Get cursor position at click location
             cursor = self.cursorForPosition(event.pos())
     
@@ -97,14 +98,16 @@ class ReadOnlyTTSTextEdit(QTextEdit):
             block_number = block.blockNumber()
             position_in_block = cursor.positionInBlock()
     
-            print(f"DEBUG: Click at block {block_number}, position {position_in_block}")
+            if _DEBUG:
+                print(f"DEBUG: Click at block {block_number}, position {position_in_block}")
     
             # Find sentence ID using TTS widget's method
             sentence_id = tts_widget.find_sentence_id_from_offset(block_number, position_in_block)
     
             if sentence_id:
                 block_idx, sent_idx = sentence_id
-                print(f"DEBUG: Clicked sentence: block {block_idx}, sentence {sent_idx}")
+                if _DEBUG:
+                    print(f"DEBUG: Clicked sentence: block {block_idx}, sentence {sent_idx}")
     
                 # Use existing navigation to jump to this sentence
                 tts_manager.set_sentence_index(block_idx, sent_idx)
@@ -113,10 +116,8 @@ class ReadOnlyTTSTextEdit(QTextEdit):
                 # Accept the event to prevent further processing
                 event.accept()
                 return
-            else:
+            elif _DEBUG:
                 print("DEBUG: Could not find sentence ID for click position")
-        else:
-            print("DEBUG: TTS not active")
     
         # If we didn't handle the click for TTS navigation, pass to parent
         super().mousePressEvent(event)
@@ -131,15 +132,58 @@ class ReadOnlyTTSWidget(QMainWindow):
     Read-only window for TTS playback with sentence highlighting.
     Opens as independent window when TTS is launched.
     """
+    
+    # Emitted once document content and sentence data are in place
+    readyForNavigation = Signal()
+    
+    # Shortcuts created by add_shortcuts, as (attribute, key sequence, slot name)
+    _SHORTCUTS = (
+        # Alt+S for play/pause
+        ('speech_shortcut', "Alt+S", 'toggle_speech'),
+        # Alt+. / Alt+, for next / previous sentence
+        ('next_sentence_shortcut', "Alt+.", 'navigate_to_next_sentence'),
+        ('prev_sentence_shortcut', "Alt+,", 'navigate_to_previous_sentence'),
+        # Alt+] / Alt+[ for next / previous paragraph (block)
+        ('next_paragraph_shortcut', "Alt+]", 'navigate_to_next_paragraph'),
+        ('prev_paragraph_shortcut', "Alt+[", 'navigate_to_previous_paragraph'),
+        # Alt+PageDown / Alt+PageUp for next / previous heading block
+        ('next_heading_block_shortcut', "Alt+PgDown", 'navigate_to_next_heading_block'),
+        ('prev_heading_block_shortcut', "Alt+PgUp", 'navigate_to_previous_heading_block'),
+        # Shift+Alt+PageDown / Shift+Alt+PageUp for next / previous horizontal rule section
+        ('next_horizontal_rule_section_shortcut', "Shift+Alt+PgDown", 'navigate_to_next_horizontal_rule_section'),
+        ('prev_horizontal_rule_section_shortcut', "Shift+Alt+PgUp", 'navigate_to_previous_horizontal_rule_section'),
+        # Ctrl+PageDown / Ctrl+PageUp scroll between headings without moving TTS
+        ('next_heading_scroll_shortcut', "Ctrl+PgDown", 'scroll_to_next_heading'),
+        ('prev_heading_scroll_shortcut', "Ctrl+PgUp", 'scroll_to_previous_heading'),
+        # Ctrl+0 to reset zoom
+        ('zoom_reset_shortcut', "Ctrl+0", 'zoom_reset'),
+        # Escape to close
+        ('escape_shortcut', "Escape", 'close'),
+        # F11 for fullscreen toggle
+        ('fullscreen_shortcut', "F11", 'toggle_fullscreen'),
+        # Alt+Home to reset to first sentence in first block
+        ('home_shortcut', "Alt+Home", 'navigate_to_first_sentence'),
+        # Alt+O to open original PDF
+        ('original_pdf_shortcut', "Alt+O", 'open_original_pdf'),
+        # Alt+G for go to page
+        ('go_to_page_shortcut', "Alt+G", 'show_go_to_page_dialog'),
+    )
    
     def __init__(self, parent=None, config=None, assistivox_dir=None):
         super().__init__(parent)
         
+        # Created after the UI is set up; None until then
+        self.tts_manager = None
+        
         # Store references
         self.config = config
         self.assistivox_dir = assistivox_dir
         self.parent_editor = parent
         self.sentence_boundary_data = None  # Store sentence detection results
+        self._detection_thread = None  # Background sentence detection in progress, if any
+        self._page_index = None  # PAGE BREAK positions and page starts, built on demand
+        self._page_index_source = None  # sentence_boundary_data the page index was built from
+        self.is_ready = False  # Set when content is loaded and can be navigated
         
         # Set up independent window with proper flags
         self.setWindowFlags(Qt.Window)
@@ -154,6 +198,15 @@ class ReadOnlyTTSWidget(QMainWindow):
         if hasattr(parent, 'zoom_level'):
             self.zoom_level = parent.zoom_level
         
+        # Font size last applied by apply_zoom, so unchanged sizes skip the relayout
+        self._applied_font_size = None
+        
+        # Coalesce bursts of zoom steps (e.g. a Ctrl+wheel flick) into one relayout
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self.apply_zoom)
+        
         # Set up UI
         self.setup_ui()
         
@@ -165,7 +218,11 @@ class ReadOnlyTTSWidget(QMainWindow):
 
         # Store markdown structure for navigation
         self.markdown_structure = []  # Hierarchical structure of the document
+        self._flat_headings = []  # markdown_structure headings in document order
+        self._flat_headings_source = None  # markdown_structure they were flattened from
         self.heading_positions = {}   # Maps heading IDs to (block_idx, sent_idx)
+        self._sorted_heading_positions = []  # heading_positions values in document order
+        self._heading_block_set = frozenset()  # Block indexes that start a heading
 
     def setup_ui(self):
         """Set up the user interface"""
@@ -175,13 +232,13 @@ class ReadOnlyTTSWidget(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         # Header
-        header = QLabel("Text-to-Speech Reader")
-        header.setAlignment(Qt.AlignCenter)
-        font = header.font()
+        self.header_label = QLabel("Text-to-Speech Reader")
+        self.header_label.setAlignment(Qt.AlignCenter)
+        font = self.header_label.font()
         font.setBold(True)
         font.setPointSize(14)
-        header.setFont(font)
-        layout.addWidget(header)
+        self.header_label.setFont(font)
+        layout.addWidget(self.header_label)
         
         # Separator
         separator = QFrame()
@@ -191,6 +248,7 @@ class ReadOnlyTTSWidget(QMainWindow):
         
         # Text display area
         self.text_edit = ReadOnlyTTSTextEdit(self)
+        self.text_edit._tts_widget = self
         layout.addWidget(self.text_edit)
         
         # Control buttons
@@ -244,41 +302,10 @@ class ReadOnlyTTSWidget(QMainWindow):
         
     def add_shortcuts(self):
         """Add keyboard shortcuts for TTS navigation and controls"""
-        # Alt+S for play/pause
-        self.speech_shortcut = QShortcut(QKeySequence("Alt+S"), self)
-        self.speech_shortcut.activated.connect(self.toggle_speech)
-    
-        # Alt+. for next sentence
-        self.next_sentence_shortcut = QShortcut(QKeySequence("Alt+."), self)
-        self.next_sentence_shortcut.activated.connect(self.navigate_to_next_sentence)
-        
-        # Alt+, for previous sentence  
-        self.prev_sentence_shortcut = QShortcut(QKeySequence("Alt+,"), self)
-        self.prev_sentence_shortcut.activated.connect(self.navigate_to_previous_sentence)
-        
-        # Alt+] for next paragraph (block)
-        self.next_paragraph_shortcut = QShortcut(QKeySequence("Alt+]"), self)
-        self.next_paragraph_shortcut.activated.connect(self.navigate_to_next_paragraph)
-        
-        # Alt+[ for previous paragraph (block)
-        self.prev_paragraph_shortcut = QShortcut(QKeySequence("Alt+["), self)
-        self.prev_paragraph_shortcut.activated.connect(self.navigate_to_previous_paragraph)
-
-        # Alt+PageDown for next heading block
-        self.next_heading_block_shortcut = QShortcut(QKeySequence("Alt+PgDown"), self)
-        self.next_heading_block_shortcut.activated.connect(self.navigate_to_next_heading_block)
-
-        # Alt+PageUp for previous heading block  
-        self.prev_heading_block_shortcut = QShortcut(QKeySequence("Alt+PgUp"), self)
-        self.prev_heading_block_shortcut.activated.connect(self.navigate_to_previous_heading_block)
-
-        # Shift+Alt+PageDown for next horizontal rule section
-        self.next_horizontal_rule_section_shortcut = QShortcut(QKeySequence("Shift+Alt+PgDown"), self)
-        self.next_horizontal_rule_section_shortcut.activated.connect(self.navigate_to_next_horizontal_rule_section)
-
-        # Shift+Alt+PageUp for previous horizontal rule section
-        self.prev_horizontal_rule_section_shortcut = QShortcut(QKeySequence("Shift+Alt+PgUp"), self)
-        self.prev_horizontal_rule_section_shortcut.activated.connect(self.navigate_to_previous_horizontal_rule_section)
+        for attribute, key_sequence, slot_name in self._SHORTCUTS:
+            shortcut = QShortcut(QKeySequence(key_sequence), self)
+            shortcut.activated.connect(getattr(self, slot_name))
+            setattr(self, attribute, shortcut)
         
         # Zoom shortcuts
         self.zoom_in_shortcut = QShortcut(QKeySequence.ZoomIn, self)
@@ -286,66 +313,10 @@ class ReadOnlyTTSWidget(QMainWindow):
         
         self.zoom_out_shortcut = QShortcut(QKeySequence.ZoomOut, self)
         self.zoom_out_shortcut.activated.connect(self.zoom_out)
-        
-        self.zoom_reset_shortcut = QShortcut(QKeySequence("Ctrl+0"), self)
-        self.zoom_reset_shortcut.activated.connect(self.zoom_reset)
-        
-        # Escape to close
-        self.escape_shortcut = QShortcut(QKeySequence("Escape"), self)
-        self.escape_shortcut.activated.connect(self.close)
-
-        # F11 for fullscreen toggle
-        self.fullscreen_shortcut = QShortcut(QKeySequence("F11"), self)
-        self.fullscreen_shortcut.activated.connect(self.toggle_fullscreen)
-
-        # Alt+Home to reset to first sentence in first block
-        self.home_shortcut = QShortcut(QKeySequence("Alt+Home"), self)
-        self.home_shortcut.activated.connect(self.navigate_to_first_sentence)
-
-        # Add shortcut for Alt+O to open original PDF
-        self.original_pdf_shortcut = QShortcut(QKeySequence("Alt+O"), self)
-        self.original_pdf_shortcut.activated.connect(self.open_original_pdf)
-
-        # Alt+G for go to page
-        self.go_to_page_shortcut = QShortcut(QKeySequence("Alt+G"), self)
-        self.go_to_page_shortcut.activated.connect(self.show_go_to_page_dialog)
-
-    def keyPressEvent(self, event):
-        """Handle key press events for the TTS window"""
-        # Handle Alt+PageUp/PageDown for heading navigation FIRST
-        if event.key() == Qt.Key_PageDown and event.modifiers() & Qt.AltModifier:
-            self.navigate_to_next_heading_block()  # Changed from navigate_to_next_heading()
-            event.accept()
-            return
-    
-        if event.key() == Qt.Key_PageUp and event.modifiers() & Qt.AltModifier:
-            self.navigate_to_previous_heading_block()  # Changed from navigate_to_previous_heading()
-            event.accept()
-            return
-        
-        # Handle Ctrl+PageUp/PageDown for scrolling
-        if event.key() == Qt.Key_PageDown and event.modifiers() & Qt.ControlModifier:
-            self.scroll_to_next_heading()
-            event.accept()
-            return
-        
-        if event.key() == Qt.Key_PageUp and event.modifiers() & Qt.ControlModifier:
-            self.scroll_to_previous_heading()
-            event.accept()
-            return
-        
-        # Handle Escape to close
-        if event.key() == Qt.Key_Escape:
-            self.close()
-            event.accept()
-            return
-    
-        # Pass other key events to parent
-        super().keyPressEvent(event)
 
     def start_tts_automatically(self):
          """Start TTS automatically when widget opens"""
-         if hasattr(self, 'tts_manager') and self.text_edit.document() and not self.text_edit.document().isEmpty():
+         if self.tts_manager is not None and self.text_edit.document() and not self.text_edit.document().isEmpty():
              # Start TTS directly without toggling
              if not self.tts_manager.is_speaking:
                  self.tts_manager.toggle_speech()
@@ -357,44 +328,126 @@ class ReadOnlyTTSWidget(QMainWindow):
 
     def set_document_content(self, markdown_content):
         """Set the document content to display"""
-        print(f"DEBUG: Markdown content length: {len(markdown_content)}")
+        if _DEBUG:
+            print(f"DEBUG: Markdown content length: {len(markdown_content)}")
     
         # Parse markdown structure BEFORE conversion
         self.markdown_structure = self._parse_markdown_to_structure(markdown_content)
     
         # Use MarkdownHandler to set the content properly
-        from gui.components.markdown_handler import MarkdownHandler
         MarkdownHandler.markdown_to_rich_text(self.text_edit.document(), markdown_content)
+        self._split_long_blocks(self.text_edit.document())
     
         # Check the result
         document = self.text_edit.document()
-        print(f"DEBUG: Document character count after markdown: {document.characterCount()}")
-        print(f"DEBUG: Plain text length: {len(self.text_edit.toPlainText())}")
+        if _DEBUG:
+            print(f"DEBUG: Document character count after markdown: {document.characterCount()}")
+            print(f"DEBUG: Plain text length: {len(self.text_edit.toPlainText())}")
     
-        # Run sentence boundary detection and store results when document is set
-        try:
-            from gui.nlp.sentence_detector import SentenceDetector
-            import os
+        # Run sentence boundary detection in the background; navigation data
+        # is filled in by _on_sentence_detection_complete
+        self.sentence_boundary_data = None
+        self.heading_positions = {}
+        self._start_sentence_detection()
+    
+        # Reset TTS sentence index when setting new content
+        if self.tts_manager is not None:
+            self.tts_manager.reset_sentence_index()
+    
+    def _split_long_blocks(self, document):
+        """
+        Split rendered blocks longer than _MAX_BLOCK_LENGTH into shorter blocks
         
-            # Create sentence detector with config
-            config_path = os.path.join(self.assistivox_dir, "config.json")
-            detector = SentenceDetector(config_path)
+        Each split replaces a space with a block separator, so every character
+        keeps its document position and cursor positions taken from the editor
+        still map to the same text. Splits prefer sentence ends; table cells
+        are left alone.
+        """
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        
+        block = document.begin()
+        while block.isValid():
+            text = block.text()
+            if len(text) > _MAX_BLOCK_LENGTH:
+                cursor.setPosition(block.position())
+                split_at = -1
+                if cursor.currentTable() is None:
+                    split_at = text.rfind('. ', 0, _MAX_BLOCK_LENGTH)
+                    split_at = split_at + 1 if split_at > 0 else text.rfind(' ', 0, _MAX_BLOCK_LENGTH)
+                
+                if split_at > 0:
+                    # Swap the space for a block break; the rest becomes the next block
+                    cursor.setPosition(block.position() + split_at)
+                    cursor.deleteChar()
+                    cursor.insertBlock(self._continuation_block_format(block))
+                    
+                    # Check the remainder, which may still be too long
+                    block = cursor.block()
+                    continue
+            
+            block = block.next()
         
-            # Detect sentences in the document and store in widget
-            self.sentence_boundary_data = detector.detect_sentences_in_document(self.text_edit.document())
+        cursor.endEditBlock()
+
+    def _continuation_block_format(self, block):
+        """
+        Return the block format for the remainder of a split block
         
-            print(f"Sentence detection complete: {len(self.sentence_boundary_data)} blocks processed")
+        The remainder keeps the paragraph's layout but isn't a new heading or
+        list item; list text keeps the list's indent without a second bullet.
+        """
+        block_format = QTextBlockFormat(block.blockFormat())
+        block_format.setHeadingLevel(0)
+        text_list = block.textList()
+        if text_list is not None:
+            block_format.setObjectIndex(-1)  # Leave the list
+            block_format.setIndent(text_list.format().indent())
+        return block_format
+
+    def _start_sentence_detection(self):
+        """Start sentence boundary detection for the current document on a worker thread"""
+        from gui.nlp.sentence_detector import SentenceDetectionThread
+        
+        config_path = os.path.join(self.assistivox_dir, "config.json")
+        detector = get_shared_detector(config_path)
+        
+        # Navigation waits for the new sentence data
+        self.is_ready = False
+        
+        # Parented to the window so Qt keeps it alive even if a newer load replaces it
+        thread = SentenceDetectionThread(detector, self.text_edit.document(), self)
+        thread.detection_complete.connect(self._on_sentence_detection_complete)
+        thread.finished.connect(thread.deleteLater)
+        self._detection_thread = thread
+        thread.start()
+
+    def _on_sentence_detection_complete(self, sentence_data):
+        """Store detection results and map headings once sentence detection finishes"""
+        # Ignore results for content that has since been replaced
+        if self.sender() is not self._detection_thread:
+            return
+        self._detection_thread = None
         
+        self.sentence_boundary_data = sentence_data
+        if _DEBUG:
+            print(f"Sentence detection complete: {len(sentence_data)} blocks processed")
+        try:
             # Map headings to their positions in the rendered text
             self._map_headings_to_positions()
-        
         except Exception as e:
-            print(f"Error during sentence detection: {e}")
-            self.sentence_boundary_data = None
-    
-        # Reset TTS sentence index when setting new content
-        if hasattr(self, 'tts_manager'):
-            self.tts_manager.reset_sentence_index()
+            print(f"Error mapping headings: {e}")
+            self.heading_positions = {}
+        
+        self.is_ready = True
+        self.readyForNavigation.emit()
+
+    def _run_when_ready(self, callback):
+        """Call callback now if sentence data is loaded, otherwise once detection finishes"""
+        if self.is_ready:
+            callback()
+        else:
+            self.readyForNavigation.connect(callback, Qt.SingleShotConnection)
     
     def scroll_to_top(self):
         """Scroll to the top of the document after rendering is complete"""
@@ -409,7 +462,7 @@ class ReadOnlyTTSWidget(QMainWindow):
 
     def toggle_speech(self):
         """Toggle text-to-speech on/off"""
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             self.tts_manager.toggle_speech()
             # Update button text based on TTS state
             if self.tts_manager.is_speaking:
@@ -419,18 +472,69 @@ class ReadOnlyTTSWidget(QMainWindow):
     
     def stop_speech(self):
         """Stop text-to-speech"""
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             # This will call our enhanced stop_speech which includes cleanup
             self.tts_manager.stop_speech()
 
     def navigate_to_next_sentence(self):
         """Navigate to next sentence during TTS"""
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             self.tts_manager.navigate_to_next_sentence()
     
     def store_sentence_boundary_data(self, sentence_data):
         """Store sentence boundary data for click-to-jump functionality"""
         self.sentence_boundary_data = sentence_data
+        
+        # Build the per-block offset arrays up front so clicks only search
+        if sentence_data:
+            for block_data in sentence_data:
+                self._get_offset_arrays(block_data)
+
+    def _get_offset_arrays(self, block_data):
+        """
+        Return a block's sentence start and end offsets as int arrays, cached on the block data
+        
+        The (start, end) tuples in 'offsets' stay as they are for the TTS manager;
+        the compact parallel arrays are what the binary search runs over.
+        """
+        start_offsets = block_data.get('start_offsets')
+        if start_offsets is None:
+            offsets = block_data['offsets']
+            start_offsets = array('i', [start for start, end in offsets])
+            block_data['start_offsets'] = start_offsets
+            block_data['end_offsets'] = array('i', [end for start, end in offsets])
+        return start_offsets, block_data['end_offsets']
+
+    def _get_stripped_sentences(self, block_data):
+        """
+        Return a block's sentences stripped and stripped-casefolded, cached on the block data
+        
+        Navigation and heading mapping compare these forms over and over, so they
+        are built once per block instead of on every scan.
+        """
+        stripped = block_data.get('stripped')
+        if stripped is None:
+            stripped = [sentence.strip() for sentence in block_data['sentences']]
+            block_data['stripped'] = stripped
+            block_data['stripped_folded'] = [sentence.casefold() for sentence in stripped]
+        return stripped, block_data['stripped_folded']
+
+    def _find_sentence_in_block(self, block_data, offset):
+        """
+        Binary search a block's sentence offsets for the sentence containing offset
+        
+        Args:
+            block_data (dict): Sentence boundary data for one block
+            offset (int): Offset from the beginning of the block
+        
+        Returns:
+            int: Sentence index, or None if offset falls outside every sentence
+        """
+        start_offsets, end_offsets = self._get_offset_arrays(block_data)
+        sentence_index = bisect.bisect_right(start_offsets, offset) - 1
+        if sentence_index >= 0 and offset <= end_offsets[sentence_index]:
+            return sentence_index
+        return None
 
     def find_sentence_id_from_offset(self, block_number, offset):
         """
@@ -446,66 +550,70 @@ class ReadOnlyTTSWidget(QMainWindow):
         if not self.sentence_boundary_data or block_number >= len(self.sentence_boundary_data):
             return None
         
-        block_data = self.sentence_boundary_data[block_number]
-        offsets = block_data['offsets']
-        sentences = block_data['sentences']
-    
-        # Find the sentence that contains the given offset
-        for sentence_index, (start_offset, end_offset) in enumerate(offsets):
-            if start_offset <= offset <= end_offset:
-                return (block_number, sentence_index)
+        # Offsets are sorted, so find the containing sentence by binary search
+        sentence_index = self._find_sentence_in_block(self.sentence_boundary_data[block_number], offset)
+        if sentence_index is None:
+            return None
     
-        return None
+        return (block_number, sentence_index)
 
     def navigate_to_previous_sentence(self):
         """Navigate to previous sentence during TTS"""
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             self.tts_manager.navigate_to_previous_sentence()
 
     def navigate_to_next_paragraph(self):
         """Navigate TTS to next paragraph (block) and scroll to make it visible"""
-        print("DEBUG: navigate_to_next_paragraph called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
+        if _DEBUG:
+            print("DEBUG: navigate_to_next_paragraph called")
+        tts_manager = self.tts_manager
+        if tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager available")
             return
 
-        if self.tts_manager.navigate_to_next_paragraph():
+        if tts_manager.navigate_to_next_paragraph():
             # Get the new position and scroll to it
-            block_idx, sent_idx = self.tts_manager.tts_sentence_index
+            block_idx, sent_idx = tts_manager.tts_sentence_index
             self._scroll_to_position(block_idx, sent_idx)
-            print(f"DEBUG: Scrolled to next paragraph at block {block_idx}, sentence {sent_idx}")
+            if _DEBUG:
+                print(f"DEBUG: Scrolled to next paragraph at block {block_idx}, sentence {sent_idx}")
 
     def navigate_to_previous_paragraph(self):
         """Navigate TTS to previous paragraph (block) and scroll to make it visible"""
-        print("DEBUG: navigate_to_previous_paragraph called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
+        if _DEBUG:
+            print("DEBUG: navigate_to_previous_paragraph called")
+        tts_manager = self.tts_manager
+        if tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager available")
             return
 
-        if self.tts_manager.navigate_to_previous_paragraph():
+        if tts_manager.navigate_to_previous_paragraph():
             # Get the new position and scroll to it
-            block_idx, sent_idx = self.tts_manager.tts_sentence_index
+            block_idx, sent_idx = tts_manager.tts_sentence_index
             self._scroll_to_position(block_idx, sent_idx)
-            print(f"DEBUG: Scrolled to previous paragraph at block {block_idx}, sentence {sent_idx}")
+            if _DEBUG:
+                print(f"DEBUG: Scrolled to previous paragraph at block {block_idx}, sentence {sent_idx}")
 
     def zoom_in(self):
         """Increase zoom level"""
         if self.zoom_level < 300:
             self.zoom_level += 10
-            self.apply_zoom()
+            self._zoom_timer.start()
             self.update_zoom_display()
    
     def zoom_out(self):
         """Decrease zoom level"""
         if self.zoom_level > 50:
             self.zoom_level -= 10
-            self.apply_zoom()
+            self._zoom_timer.start()
             self.update_zoom_display()
    
     def zoom_reset(self):
         """Reset zoom to 100%"""
         self.zoom_level = 100
-        self.apply_zoom()
+        self._zoom_timer.start()
         self.update_zoom_display()
    
     def apply_zoom(self):
@@ -518,25 +626,35 @@ class ReadOnlyTTSWidget(QMainWindow):
         # Calculate new font size
         new_size = base_font_size * (self.zoom_level / 100.0)
     
+        # Setting the same font again would still relayout the whole document
+        if self._applied_font_size is not None and abs(new_size - self._applied_font_size) < 0.01:
+            return
+        self._applied_font_size = new_size
+    
         # Store cursor position and scroll position
         cursor_position = self.text_edit.textCursor().position()
         scroll_position = self.text_edit.verticalScrollBar().value()
     
-        # Set the base font for the text editor and document
-        # This affects the default font size while preserving all rich text formatting
-        font = self.text_edit.font()
-        font.setPointSizeF(new_size)
-        self.text_edit.setFont(font)
-    
-        # Set the default font for the document (affects display scaling)
-        document = self.text_edit.document()
-        document.setDefaultFont(font)
-    
-        # Restore cursor and scroll positions
-        cursor = self.text_edit.textCursor()
-        cursor.setPosition(min(cursor_position, document.characterCount() - 1))
-        self.text_edit.setTextCursor(cursor)
-        self.text_edit.verticalScrollBar().setValue(scroll_position)
+        # Repaint once after the font change and position restore, not after each step
+        self.text_edit.setUpdatesEnabled(False)
+        try:
+            # Set the base font for the text editor and document
+            # This affects the default font size while preserving all rich text formatting
+            font = self.text_edit.font()
+            font.setPointSizeF(new_size)
+            self.text_edit.setFont(font)
+        
+            # Set the default font for the document (affects display scaling)
+            document = self.text_edit.document()
+            document.setDefaultFont(font)
+        
+            # Restore cursor and scroll positions
+            cursor = self.text_edit.textCursor()
+            cursor.setPosition(min(cursor_position, document.characterCount() - 1))
+            self.text_edit.setTextCursor(cursor)
+            self.text_edit.verticalScrollBar().setValue(scroll_position)
+        finally:
+            self.text_edit.setUpdatesEnabled(True)
 
     def update_zoom_display(self):
         """Update the zoom display label to show current zoom level"""
@@ -570,7 +688,7 @@ class ReadOnlyTTSWidget(QMainWindow):
 
     def navigate_to_first_sentence(self):
         """Navigate to the first sentence in the first block"""
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             if self.tts_manager.is_speaking:
                 # If TTS is playing, jump to first sentence
                 self.tts_manager.navigate_to_first_sentence()
@@ -581,101 +699,73 @@ class ReadOnlyTTSWidget(QMainWindow):
 
     def navigate_to_next_heading(self):
         """Navigate TTS to the next markdown heading of any level"""
-        print("DEBUG: navigate_to_next_heading called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
+        if _DEBUG:
+            print("DEBUG: navigate_to_next_heading called")
+        tts_manager = self.tts_manager
+        if tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager available")
             return
 
-        print(f"DEBUG: sentence_boundary_data exists: {self.sentence_boundary_data is not None}")
-        if self.sentence_boundary_data:
-            print(f"DEBUG: Number of blocks: {len(self.sentence_boundary_data)}")
-            current_block, current_sent = self.tts_manager.tts_sentence_index
-            print(f"DEBUG: Current TTS position: block {current_block}, sentence {current_sent}")
+        if _DEBUG:
+            print(f"DEBUG: sentence_boundary_data exists: {self.sentence_boundary_data is not None}")
+            if self.sentence_boundary_data:
+                print(f"DEBUG: Number of blocks: {len(self.sentence_boundary_data)}")
+                current_block, current_sent = tts_manager.tts_sentence_index
+                print(f"DEBUG: Current TTS position: block {current_block}, sentence {current_sent}")
 
-            # Show some sample sentences to check if headings exist
-            for i, block_data in enumerate(self.sentence_boundary_data[:5]):  # First 5 blocks
-                if block_data['sentences']:
-                    first_sentence = block_data['sentences'][0].strip()
-                    print(f"DEBUG: Block {i} first sentence: '{first_sentence}' (starts with #: {first_sentence.startswith('#')})")
+                # Show some sample sentences to check if headings exist
+                for i, block_data in enumerate(self.sentence_boundary_data[:5]):  # First 5 blocks
+                    if block_data['sentences']:
+                        first_sentence = block_data['sentences'][0].strip()
+                        print(f"DEBUG: Block {i} first sentence: '{first_sentence}' (heading: {self.is_heading_block(i)})")
     
         heading_position = self._find_next_heading()
-        print(f"DEBUG: Next heading position: {heading_position}")
+        if _DEBUG:
+            print(f"DEBUG: Next heading position: {heading_position}")
         if heading_position is not None:
             block_idx, sent_idx = heading_position
-            if self.tts_manager.is_speaking:
+            if tts_manager.is_speaking:
                 # If TTS is playing, jump to the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
+                tts_manager.set_sentence_index(block_idx, sent_idx)
+                tts_manager._navigate_to_sentence(block_idx, sent_idx)
             else:
                 # If TTS is stopped, start from the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
+                tts_manager.set_sentence_index(block_idx, sent_idx)
+                tts_manager.toggle_speech()
         else:
-            print("DEBUG: No next heading found")
+            if _DEBUG:
+                print("DEBUG: No next heading found")
 
     def _find_next_heading(self):
         """Find the next heading using the parsed markdown structure"""
-        if not self.heading_positions or not hasattr(self, 'tts_manager'):
+        if not self.heading_positions or self.tts_manager is None:
             return None
     
         # Get current TTS position
         current_block, current_sent = self.tts_manager.tts_sentence_index
     
-        # Get all heading positions sorted by position
-        positions = [(pos[0], pos[1], heading_id) for heading_id, pos in self.heading_positions.items()]
-        positions.sort()  # Sort by (block_idx, sent_idx)
-    
         # Find next heading after current position
-        for block_idx, sent_idx, heading_id in positions:
-            if (block_idx > current_block or
-                (block_idx == current_block and sent_idx > current_sent)):
-                return (block_idx, sent_idx)
+        positions = self._sorted_heading_positions
+        idx = bisect.bisect_right(positions, (current_block, current_sent))
+        if idx < len(positions):
+            return positions[idx]
     
         return None
     
     def _find_previous_heading(self):
         """Find the previous heading using the parsed markdown structure"""
-        if not self.heading_positions or not hasattr(self, 'tts_manager'):
+        if not self.heading_positions or self.tts_manager is None:
             return None
     
         # Get current TTS position
         current_block, current_sent = self.tts_manager.tts_sentence_index
     
-        # Get all heading positions sorted by position (reverse for previous)
-        positions = [(pos[0], pos[1], heading_id) for heading_id, pos in self.heading_positions.items()]
-        positions.sort(reverse=True)  # Sort in reverse order
-    
-        # Find previous heading before current position
-        for block_idx, sent_idx, heading_id in positions:
-            if (block_idx < current_block or
-                (block_idx == current_block and sent_idx < current_sent)):
-                return (block_idx, sent_idx)
-    
-        return None
-
-    def _find_previous_heading_for_scroll(self):
-        """Find the previous heading for scrolling based on current view position"""
-        if not self.heading_positions:
-            return None
-    
-        # Get current cursor position in the document
-        cursor = self.text_edit.textCursor()
-        cursor_position = cursor.position()
-        
-        # Convert cursor position to block/sentence coordinates
-        current_block, current_sent = self._convert_cursor_position_to_block_sentence(cursor_position)
-        if current_block is None:
-            return None
-    
-        # Get all heading positions sorted by position (reverse for previous)
-        positions = [(pos[0], pos[1], heading_id) for heading_id, pos in self.heading_positions.items()]
-        positions.sort(reverse=True)  # Sort in reverse order
-    
         # Find previous heading before current position
-        for block_idx, sent_idx, heading_id in positions:
-            if (block_idx < current_block or
-                (block_idx == current_block and sent_idx < current_sent)):
-                return (block_idx, sent_idx)
+        positions = self._sorted_heading_positions
+        idx = bisect.bisect_left(positions, (current_block, current_sent)) - 1
+        if idx >= 0:
+            return positions[idx]
     
         return None
 
@@ -684,62 +774,59 @@ class ReadOnlyTTSWidget(QMainWindow):
         if not self.sentence_boundary_data:
             return None, None
 
-        position_counter = 0
-
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if not block_data['sentences']:
-                position_counter += 1  # Empty block still takes 1 character (newline)
-                continue
-
-            # Use the original block text, not reconstructed from sentences
-            block_text = block_data['block_text']
-            block_length = len(block_text)
-            block_end = position_counter + block_length
-
-            if cursor_position >= position_counter and cursor_position <= block_end:
-                # We're in this block, find which sentence
-                position_in_block = cursor_position - position_counter
-
-                if block_data['offsets']:
-                    for sent_idx, (start_offset, end_offset) in enumerate(block_data['offsets']):
-                        if position_in_block >= start_offset and position_in_block <= end_offset:
-                            print(f"DEBUG: Cursor at position {cursor_position} -> block {block_idx}, sentence {sent_idx}")
-                            return block_idx, sent_idx
-
-                # If not found in any sentence, return first sentence of block
-                print(f"DEBUG: Cursor at position {cursor_position} -> block {block_idx}, sentence 0 (default)")
-                return block_idx, 0
-
-            position_counter = block_end + 1  # +1 for newline between blocks
+        # Qt's block table finds the block holding the position directly
+        block = self.text_edit.document().findBlock(cursor_position)
+        last_block = len(self.sentence_boundary_data) - 1
 
         # If we're past the end, return the last block/sentence
-        if self.sentence_boundary_data:
-            last_block = len(self.sentence_boundary_data) - 1
+        if not block.isValid() or block.blockNumber() > last_block:
             last_sentence = len(self.sentence_boundary_data[last_block]['sentences']) - 1 if self.sentence_boundary_data[last_block]['sentences'] else 0
-            print(f"DEBUG: Cursor at position {cursor_position} -> block {last_block}, sentence {last_sentence} (end of document)")
+            if _DEBUG:
+                print(f"DEBUG: Cursor at position {cursor_position} -> block {last_block}, sentence {last_sentence} (end of document)")
             return last_block, last_sentence
 
-        return None, None
+        block_idx = block.blockNumber()
+        block_data = self.sentence_boundary_data[block_idx]
+        if not block_data['sentences']:
+            # Empty block has nothing to read, use the start of the next block with sentences
+            for next_idx in range(block_idx + 1, last_block + 1):
+                if self.sentence_boundary_data[next_idx]['sentences']:
+                    if _DEBUG:
+                        print(f"DEBUG: Cursor at position {cursor_position} -> block {next_idx}, sentence 0 (after empty block)")
+                    return next_idx, 0
+            return block_idx, 0
+
+        # We're in this block, find which sentence
+        position_in_block = cursor_position - block.position()
+        sent_idx = self._find_sentence_in_block(block_data, position_in_block)
+        if sent_idx is not None:
+            if _DEBUG:
+                print(f"DEBUG: Cursor at position {cursor_position} -> block {block_idx}, sentence {sent_idx}")
+            return block_idx, sent_idx
+
+        # If not found in any sentence, return first sentence of block
+        if _DEBUG:
+            print(f"DEBUG: Cursor at position {cursor_position} -> block {block_idx}, sentence 0 (default)")
+        return block_idx, 0
 
     def _parse_markdown_to_structure(self, markdown_content):
         """Parse markdown into hierarchical structure"""
-        import re
+        # Without a '#' there are no headings, so skip the per-line pass entirely
+        if '#' not in markdown_content:
+            return []
     
         lines = markdown_content.split('\n')
         structure = []
         heading_stack = []  # Stack to track heading hierarchy
-        current_content = []
+        headings = []  # Every heading in document order
+        content_lines = None  # Content lines of the most recent heading
         heading_id = 0
     
         for line_idx, line in enumerate(lines):
-            heading_match = re.match(r'^(#{1,6})\s+(.+)', line.strip())
+            # Only lines containing '#' can be headings, skip the strip and regex for the rest
+            heading_match = _HEADING_RE.match(line.strip()) if '#' in line else None
         
             if heading_match:
-                # Save any accumulated content to the previous section
-                if current_content and heading_stack:
-                    heading_stack[-1]['content'] = '\n'.join(current_content)
-                current_content = []
-            
                 level = len(heading_match.group(1))
                 text = heading_match.group(2).strip()
                 heading_id += 1
@@ -748,8 +835,10 @@ class ReadOnlyTTSWidget(QMainWindow):
                     'id': heading_id,
                     'level': level,
                     'text': text,
+                    'text_folded': text.casefold(),  # For case-insensitive matching
                     'line_idx': line_idx,
                     'content': '',
+                    'content_lines': [],
                     'children': [],
                     'block_idx': None,
                     'sent_idx': None
@@ -757,9 +846,7 @@ class ReadOnlyTTSWidget(QMainWindow):
             
                 # Pop stack until we find the right parent level
                 while heading_stack and heading_stack[-1]['level'] >= level:
-                    completed_heading = heading_stack.pop()
-                    completed_heading['content'] = '\n'.join(current_content) if current_content else completed_heading['content']
-                    current_content = []
+                    heading_stack.pop()
             
                 # Add to parent or root
                 if heading_stack:
@@ -768,82 +855,143 @@ class ReadOnlyTTSWidget(QMainWindow):
                     structure.append(heading_obj)
             
                 heading_stack.append(heading_obj)
-            else:
-                # Regular content line
-                current_content.append(line)
-    
-        # Handle any remaining content
-        if current_content and heading_stack:
-            heading_stack[-1]['content'] = '\n'.join(current_content)
-    
-        print(f"DEBUG: Parsed markdown structure with {self._count_headings(structure)} headings")
+                headings.append(heading_obj)
+                content_lines = heading_obj['content_lines']
+            elif content_lines is not None:
+                # Regular content line belongs to the most recent heading
+                content_lines.append(line)
+    
+        # Join each heading's content once, now that all lines are collected
+        for heading in headings:
+            heading['content'] = '\n'.join(heading.pop('content_lines'))
+    
+        if _DEBUG:
+            print(f"DEBUG: Parsed markdown structure with {self._count_headings(structure)} headings")
         return structure
 
     def _count_headings(self, structure):
-        """Recursively count all headings in the structure"""
-        count = 0
-        for item in structure:
-            count += 1
-            count += self._count_headings(item.get('children', []))
-        return count
+        """Count all headings in the structure"""
+        return len(self._flatten_headings(structure))
 
     def _map_headings_to_positions(self):
         """Map heading text to positions in rendered document"""
+        # Drop the sorted positions of the previous content
+        self._sorted_heading_positions = []
+        self._heading_block_set = frozenset()
         if not self.sentence_boundary_data or not self.markdown_structure:
             return
         
         # Flatten all headings for easier searching
-        all_headings = []
-        self._flatten_headings(self.markdown_structure, all_headings)
+        all_headings = self._get_flat_headings()
+        
+        # Index every distinct sentence by its first position, so a heading that
+        # is a whole sentence needs a single lookup
+        sentence_index = {}
+        get_stripped = self._get_stripped_sentences
+        add_sentence = sentence_index.setdefault
+        for block_idx, block_data in enumerate(self.sentence_boundary_data):
+            for sent_idx, sentence_clean in enumerate(get_stripped(block_data)[1]):
+                add_sentence(sentence_clean, (block_idx, sent_idx))
         
+        # Exact sentence matches first, the rest share one containment search
+        positions = {}
+        unresolved = []
         for heading in all_headings:
-            heading_text = heading['text']
+            position = sentence_index.get(heading['text_folded'])
+            if position is None:
+                unresolved.append(heading)
+            else:
+                positions[heading['id']] = position
+        if unresolved:
+            positions.update(self._find_partial_heading_matches(unresolved))
+        
+        for heading in all_headings:
+            position = positions.get(heading['id'])
+            if position is None:
+                continue
             
-            # Search for this heading text in the sentence data
-            for block_idx, block_data in enumerate(self.sentence_boundary_data):
-                if not block_data['sentences']:
-                    continue
-                    
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    # Check if this sentence matches the heading text
-                    sentence_clean = sentence.strip().lower()
-                    heading_clean = heading_text.strip().lower()
-                    
-                    if heading_clean in sentence_clean or sentence_clean in heading_clean:
-                        heading['block_idx'] = block_idx
-                        heading['sent_idx'] = sent_idx
-                        self.heading_positions[heading['id']] = (block_idx, sent_idx)
-                        print(f"DEBUG: Mapped heading '{heading_text}' to position {block_idx}-{sent_idx}")
-                        break
-                
-                if heading['block_idx'] is not None:
-                    break
-    
-    def _flatten_headings(self, structure, result):
-        """Flatten hierarchical structure into a list for easier searching"""
-        for item in structure:
+            block_idx, sent_idx = position
+            heading['block_idx'] = block_idx
+            heading['sent_idx'] = sent_idx
+            self.heading_positions[heading['id']] = (block_idx, sent_idx)
+            if _DEBUG:
+                print(f"DEBUG: Mapped heading '{heading['text']}' to position {block_idx}-{sent_idx}")
+        
+        # Sort once here so heading navigation can binary search
+        self._sorted_heading_positions = sorted(self.heading_positions.values())
+        self._heading_block_set = frozenset(block_idx for block_idx, sent_idx in self._sorted_heading_positions)
+    
+    def _find_partial_heading_matches(self, headings):
+        """
+        Find the first sentence that contains, or is contained in, each heading's text
+        
+        All headings are matched in a single pass over the sentences, which
+        stops as soon as every heading has a position.
+        
+        Args:
+            headings (list): Heading dicts without an exact sentence match
+        
+        Returns:
+            dict: Heading id to (block_idx, sent_idx) for the headings that matched
+        """
+        pending = {heading['id']: heading['text_folded'] for heading in headings}
+        positions = {}
+        get_stripped = self._get_stripped_sentences
+        for block_idx, block_data in enumerate(self.sentence_boundary_data):
+            for sent_idx, sentence_clean in enumerate(get_stripped(block_data)[1]):
+                matched = [heading_id for heading_id, heading_clean in pending.items()
+                           if heading_clean in sentence_clean or sentence_clean in heading_clean]
+                for heading_id in matched:
+                    positions[heading_id] = (block_idx, sent_idx)
+                    del pending[heading_id]
+                if not pending:
+                    return positions
+        return positions
+    
+    def is_heading_block(self, block_idx):
+        """Return True if a mapped heading starts in the given block"""
+        return block_idx in self._heading_block_set
+
+    def _flatten_headings(self, structure):
+        """Flatten hierarchical structure into a document-order list for easier searching"""
+        result = []
+        stack = list(reversed(structure))
+        while stack:
+            item = stack.pop()
             result.append(item)
-            self._flatten_headings(item.get('children', []), result)
+            stack.extend(reversed(item.get('children', ())))
+        return result
+
+    def _get_flat_headings(self):
+        """Return the flattened markdown_structure, rebuilt when the structure is replaced"""
+        if self._flat_headings_source is not self.markdown_structure:
+            self._flat_headings = self._flatten_headings(self.markdown_structure)
+            self._flat_headings_source = self.markdown_structure
+        return self._flat_headings
 
     def scroll_to_next_heading(self):
         """Scroll view to the next heading without affecting TTS position"""
-        print("DEBUG: scroll_to_next_heading called")
+        if _DEBUG:
+            print("DEBUG: scroll_to_next_heading called")
         heading_position = self._find_next_heading_for_scroll()
         if heading_position is not None:
             block_idx, sent_idx = heading_position
             self._scroll_to_position(block_idx, sent_idx)
         else:
-            print("DEBUG: No next heading found for scrolling")
+            if _DEBUG:
+                print("DEBUG: No next heading found for scrolling")
 
     def scroll_to_previous_heading(self):
         """Scroll view to the previous heading without affecting TTS position"""
-        print("DEBUG: scroll_to_previous_heading called")
+        if _DEBUG:
+            print("DEBUG: scroll_to_previous_heading called")
         heading_position = self._find_previous_heading_for_scroll()
         if heading_position is not None:
             block_idx, sent_idx = heading_position
             self._scroll_to_position(block_idx, sent_idx)
         else:
-            print("DEBUG: No previous heading found for scrolling")
+            if _DEBUG:
+                print("DEBUG: No previous heading found for scrolling")
 
     def _find_next_heading_for_scroll(self):
         """Find the next heading for scrolling based on current view position"""
@@ -855,52 +1003,48 @@ class ReadOnlyTTSWidget(QMainWindow):
         current_block = cursor.blockNumber()
         current_position = cursor.positionInBlock()
     
-        # Get all heading positions sorted by position
-        positions = [(pos[0], pos[1], heading_id) for heading_id, pos in self.heading_positions.items()]
-        positions.sort()  # Sort by (block_idx, sent_idx)
-    
         # Find next heading after current cursor position
-        for block_idx, sent_idx, heading_id in positions:
-            if (block_idx > current_block or
-                (block_idx == current_block and sent_idx > current_position)):
-                return (block_idx, sent_idx)
+        positions = self._sorted_heading_positions
+        idx = bisect.bisect_right(positions, (current_block, current_position))
+        if idx < len(positions):
+            return positions[idx]
     
         return None
 
     def _find_previous_heading_for_scroll(self):
         """Find the previous heading for scrolling based on current view position"""
         if not self.heading_positions:
-            print("DEBUG: No heading positions available")
+            if _DEBUG:
+                print("DEBUG: No heading positions available")
             return None
 
         # Get current cursor position in the document
         cursor = self.text_edit.textCursor()
         cursor_position = cursor.position()
-        print(f"DEBUG: Current cursor position: {cursor_position}")
+        if _DEBUG:
+            print(f"DEBUG: Current cursor position: {cursor_position}")
 
         # Convert cursor position to block/sentence coordinates
         current_block, current_sent = self._convert_cursor_position_to_block_sentence(cursor_position)
         if current_block is None:
-            print("DEBUG: Could not convert cursor position")
+            if _DEBUG:
+                print("DEBUG: Could not convert cursor position")
             return None
 
-        print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
-
-        # Get all heading positions sorted by position (reverse for previous)
-        positions = [(pos[0], pos[1], heading_id) for heading_id, pos in self.heading_positions.items()]
-        positions.sort(reverse=True)  # Sort in reverse order
-
-        print(f"DEBUG: Available headings (reverse order): {positions}")
+        if _DEBUG:
+            print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
 
         # Find previous heading before current position
-        for block_idx, sent_idx, heading_id in positions:
-            print(f"DEBUG: Checking heading at block {block_idx}, sentence {sent_idx}")
-            if (block_idx < current_block or
-                (block_idx == current_block and sent_idx < current_sent)):
+        positions = self._sorted_heading_positions
+        idx = bisect.bisect_left(positions, (current_block, current_sent)) - 1
+        if idx >= 0:
+            block_idx, sent_idx = positions[idx]
+            if _DEBUG:
                 print(f"DEBUG: Found previous heading at block {block_idx}, sentence {sent_idx}")
-                return (block_idx, sent_idx)
+            return (block_idx, sent_idx)
 
-        print("DEBUG: No previous heading found")
+        if _DEBUG:
+            print("DEBUG: No previous heading found")
         return None
 
     def _scroll_to_position(self, block_idx, sent_idx):
@@ -912,14 +1056,8 @@ class ReadOnlyTTSWidget(QMainWindow):
         if sent_idx >= len(block_data['sentences']):
             return
         
-        # Calculate the absolute position in the document
-        absolute_position = 0
-        
-        # Add up all characters in previous blocks
-        for i in range(block_idx):
-            if i < len(self.sentence_boundary_data):
-                block_text = '\n'.join(self.sentence_boundary_data[i]['sentences'])
-                absolute_position += len(block_text) + 1  # +1 for newline between blocks
+        # Start from the block's absolute position in the document
+        absolute_position = self.text_edit.document().findBlockByNumber(block_idx).position()
         
         # Add offset within the current block to reach the sentence
         if block_data['offsets'] and sent_idx < len(block_data['offsets']):
@@ -934,29 +1072,35 @@ class ReadOnlyTTSWidget(QMainWindow):
         # Ensure the cursor is visible (this scrolls the view)
         self.text_edit.ensureCursorVisible()
         
-        print(f"DEBUG: Scrolled view to heading at block {block_idx}, sentence {sent_idx}")
+        if _DEBUG:
+            print(f"DEBUG: Scrolled view to heading at block {block_idx}, sentence {sent_idx}")
 
     def navigate_to_previous_heading(self):
         """Navigate TTS to the previous markdown heading of any level"""
-        print("DEBUG: navigate_to_previous_heading called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
+        if _DEBUG:
+            print("DEBUG: navigate_to_previous_heading called")
+        tts_manager = self.tts_manager
+        if tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager available")
             return
 
         heading_position = self._find_previous_heading()
-        print(f"DEBUG: Previous heading position: {heading_position}")
+        if _DEBUG:
+            print(f"DEBUG: Previous heading position: {heading_position}")
         if heading_position is not None:
             block_idx, sent_idx = heading_position
-            if self.tts_manager.is_speaking:
+            if tts_manager.is_speaking:
                 # If TTS is playing, jump to the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
+                tts_manager.set_sentence_index(block_idx, sent_idx)
+                tts_manager._navigate_to_sentence(block_idx, sent_idx)
             else:
                 # If TTS is stopped, start from the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
+                tts_manager.set_sentence_index(block_idx, sent_idx)
+                tts_manager.toggle_speech()
         else:
-            print("DEBUG: No previous heading found")
+            if _DEBUG:
+                print("DEBUG: No previous heading found")
 
     def open_original_pdf(self):
         """Open the original PDF in a shared window or bring existing one to front, jumping to current sentence page"""
@@ -972,407 +1116,219 @@ class ReadOnlyTTSWidget(QMainWindow):
         
         # Get current sentence page number
         current_page = self.get_current_sentence_page_number()
-        print(f"DEBUG: TTS Alt+O - jumping to page {current_page}")
+        if _DEBUG:
+            print(f"DEBUG: TTS Alt+O - jumping to page {current_page}")
     
         # Use shared PDF viewer window from parent editor or create new one
         if hasattr(self.parent_editor, 'pdf_viewer_window') and self.parent_editor.pdf_viewer_window:
             # Bring existing window to front and jump to page
             self.parent_editor.pdf_viewer_window.raise_()
             self.parent_editor.pdf_viewer_window.activateWindow()
-            print(f"DEBUG: Calling go_to_page({current_page}) on existing window")
+            if _DEBUG:
+                print(f"DEBUG: Calling go_to_page({current_page}) on existing window")
             self.parent_editor.pdf_viewer_window.go_to_page(current_page)
         else:
             # Create new PDF viewer window and share it
-            from gui.components.pdf_handler import PDFViewerWindow
+            from gui.components.pdf_viewer import PDFViewerWindow
             self.parent_editor.pdf_viewer_window = PDFViewerWindow(original_pdf_path, self.parent_editor)
             self.parent_editor.pdf_viewer_window.show()
             
-            # Use a timer to jump to the page after the PDF is loaded
-            from PySide6.QtCore import QTimer
-            def delayed_jump():
-                print(f"DEBUG: Delayed calling go_to_page({current_page}) on new window")
+            # Jumps right away, or as soon as the PDF has finished loading
+            if _DEBUG:
+                print(f"DEBUG: Calling go_to_page({current_page}) on new window")
                 print(f"DEBUG: PDF viewer total_pages: {self.parent_editor.pdf_viewer_window.total_pages}")
-                self.parent_editor.pdf_viewer_window.go_to_page(current_page)
-            
-            # Try immediately first
             self.parent_editor.pdf_viewer_window.go_to_page(current_page)
-            # Then try again after 500ms delay to ensure PDF is loaded
-            QTimer.singleShot(500, delayed_jump)
-            # And one more try after 1 second if needed
-            QTimer.singleShot(1000, delayed_jump)
 
-    def navigate_to_next_heading_block(self):
-        """Navigate TTS to the next heading block (Alt+PageDown)"""
-        print("DEBUG: navigate_to_next_heading_block called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
+    def _navigate_tts_to(self, find_position, description):
+        """
+        Move TTS to the position a finder returns, starting speech if it is stopped
+        
+        Args:
+            find_position (callable): Returns (block_idx, sent_idx) or None
+            description (str): What is being navigated to, for debug output
+        """
+        tts_manager = self.tts_manager
+        if tts_manager is None:
+            if _DEBUG:
+                print("DEBUG: No TTS manager available")
             return
-
-        heading_position = self._find_next_heading()
-        print(f"DEBUG: Next heading position: {heading_position}")
-        if heading_position is not None:
-            block_idx, sent_idx = heading_position
-            # Scroll to make the sentence visible
-            self._scroll_to_position(block_idx, sent_idx)
-            if self.tts_manager.is_speaking:
-                # If TTS is playing, jump to the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
-            else:
-                # If TTS is stopped, start from the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
+    
+        position = find_position()
+        if _DEBUG:
+            print(f"DEBUG: {description} position: {position}")
+        if position is None:
+            if _DEBUG:
+                print(f"DEBUG: No {description} found")
+            return
+        
+        block_idx, sent_idx = position
+        # Scroll to make the sentence visible
+        self._scroll_to_position(block_idx, sent_idx)
+        tts_manager.set_sentence_index(block_idx, sent_idx)
+        if tts_manager.is_speaking:
+            # If TTS is playing, jump to the new position
+            tts_manager._navigate_to_sentence(block_idx, sent_idx)
         else:
-            print("DEBUG: No next heading found")
+            # If TTS is stopped, start from the new position
+            tts_manager.toggle_speech()
+
+    def navigate_to_next_heading_block(self):
+        """Navigate TTS to the next heading block (Alt+PageDown)"""
+        self._navigate_tts_to(self._find_next_heading, "next heading")
     
     def navigate_to_previous_heading_block(self):
         """Navigate TTS to the previous heading block (Alt+PageUp)"""
-        print("DEBUG: navigate_to_previous_heading_block called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
-            return
-    
-        heading_position = self._find_previous_heading()
-        print(f"DEBUG: Previous heading position: {heading_position}")
-        if heading_position is not None:
-            block_idx, sent_idx = heading_position
-            # Scroll to make the sentence visible
-            self._scroll_to_position(block_idx, sent_idx)
-            if self.tts_manager.is_speaking:
-                # If TTS is playing, jump to the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
-            else:
-                # If TTS is stopped, start from the heading
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
-        else:
-            print("DEBUG: No previous heading found")
+        self._navigate_tts_to(self._find_previous_heading, "previous heading")
     
     def navigate_to_next_horizontal_rule_section(self):
         """Navigate TTS to first element after next horizontal rule (Shift+Alt+PageDown)"""
-        print("DEBUG: navigate_to_next_horizontal_rule_section called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
-            return
-    
-        next_section_position = self._find_first_element_after_next_horizontal_rule()
-        print(f"DEBUG: Next section position: {next_section_position}")
-        if next_section_position is not None:
-            block_idx, sent_idx = next_section_position
-            # Scroll to make the sentence visible
-            self._scroll_to_position(block_idx, sent_idx)
-            if self.tts_manager.is_speaking:
-                # If TTS is playing, jump to the section
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
-            else:
-                # If TTS is stopped, start from the section
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
-        else:
-            print("DEBUG: No next horizontal rule section found")
+        self._navigate_tts_to(self._find_first_element_after_next_horizontal_rule,
+                              "next horizontal rule section")
     
     def navigate_to_previous_horizontal_rule_section(self):
         """Navigate TTS to first element after previous horizontal rule (Shift+Alt+PageUp)"""
-        print("DEBUG: navigate_to_previous_horizontal_rule_section called")
-        if not hasattr(self, 'tts_manager') or not self.tts_manager:
-            print("DEBUG: No TTS manager available")
-            return
-    
-        prev_section_position = self._find_first_element_after_previous_horizontal_rule()
-        print(f"DEBUG: Previous section position: {prev_section_position}")
-        if prev_section_position is not None:
-            block_idx, sent_idx = prev_section_position
-            # Scroll to make the sentence visible
-            self._scroll_to_position(block_idx, sent_idx)
-            if self.tts_manager.is_speaking:
-                # If TTS is playing, jump to the section
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager._navigate_to_sentence(block_idx, sent_idx)
-            else:
-                # If TTS is stopped, start from the section
-                self.tts_manager.set_sentence_index(block_idx, sent_idx)
-                self.tts_manager.toggle_speech()
-        else:
-            print("DEBUG: No previous horizontal rule section found")
+        self._navigate_tts_to(self._find_first_element_after_previous_horizontal_rule,
+                              "previous horizontal rule section")
     
+    def _is_page_break(self, sentence_text):
+        """Return True if a stripped sentence is a PAGE BREAK marker"""
+        return _PAGE_BREAK_RE.match(sentence_text) is not None
+
+    def _get_page_index(self):
+        """
+        Return the PAGE BREAK index for the current sentence data
+        
+        Returns:
+            tuple: (page_breaks, page_first_sentences, page_next_content) where
+            page_breaks lists the (block_idx, sent_idx) of every PAGE BREAK in
+            document order, page_first_sentences[p] is the first readable sentence
+            of page p (0-based, the part before the first PAGE BREAK is page 0) or
+            None if that page has no content, and page_next_content[p] is the first
+            readable sentence on page p or any later page, or None.
+            Rebuilt when the sentence data is replaced.
+        """
+        if self._page_index_source is not self.sentence_boundary_data:
+            page_breaks = []
+            page_first_sentences = [None]
+            # Local bindings, this loop visits every sentence of the document
+            get_stripped = self._get_stripped_sentences
+            is_page_break = _PAGE_BREAK_RE.match
+            for block_idx, block_data in enumerate(self.sentence_boundary_data):
+                for sent_idx, sentence_text in enumerate(get_stripped(block_data)[0]):
+                    if not sentence_text:
+                        continue
+                    if is_page_break(sentence_text):
+                        page_breaks.append((block_idx, sent_idx))
+                        page_first_sentences.append(None)
+                    elif page_first_sentences[-1] is None:
+                        page_first_sentences[-1] = (block_idx, sent_idx)
+            
+            # Carry content back over empty pages so skipping them is a lookup
+            page_next_content = list(page_first_sentences)
+            for page in range(len(page_next_content) - 2, -1, -1):
+                if page_next_content[page] is None:
+                    page_next_content[page] = page_next_content[page + 1]
+            
+            self._page_index = (page_breaks, page_first_sentences, page_next_content)
+            self._page_index_source = self.sentence_boundary_data
+        return self._page_index
+
+    def _get_current_sentence_position(self):
+        """Return the current TTS (block_idx, sent_idx), falling back to the text cursor"""
+        if self.tts_manager is not None:
+            return self.tts_manager.tts_sentence_index
+        
+        # Fallback to cursor position
+        cursor_position = self.text_edit.textCursor().position()
+        return self._convert_cursor_position_to_block_sentence(cursor_position)
+
     def _find_first_element_after_next_horizontal_rule(self):
         """Find the first element after the next PAGE BREAK block"""
         if not self.sentence_boundary_data:
             return None
     
-        # Get current TTS position
-        if hasattr(self, 'tts_manager') and self.tts_manager and hasattr(self.tts_manager, 'tts_sentence_index'):
-            current_block, current_sent = self.tts_manager.tts_sentence_index
-        else:
-            # Fallback to cursor position
-            cursor = self.text_edit.textCursor()
-            cursor_position = cursor.position()
-            current_position = self._convert_cursor_position_to_block_sentence(cursor_position)
-            if current_position is None:
-                return None
-            current_block, current_sent = current_position
-    
-        print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
+        current_block, current_sent = self._get_current_sentence_position()
+        if current_block is None:
+            return None
+        if _DEBUG:
+            print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
     
-        # Find PAGE BREAK blocks in the document
-        page_break_blocks = []
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if block_data['sentences']:
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    sentence_text = sentence.strip()
-                    # Check for PAGE BREAK pattern
-                    if sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit():
-                        page_break_blocks.append((block_idx, sent_idx))
-                        print(f"DEBUG: Found PAGE BREAK at block {block_idx}, sentence {sent_idx}")
-    
-        if not page_break_blocks:
-            print("DEBUG: No PAGE BREAK blocks found")
+        page_breaks, page_first_sentences, page_next_content = self._get_page_index()
+        if not page_breaks:
+            if _DEBUG:
+                print("DEBUG: No PAGE BREAK blocks found")
             return None
     
         # Find next PAGE BREAK after current position
-        next_page_break = None
-        for block_idx, sent_idx in page_break_blocks:
-            if (block_idx > current_block or
-                (block_idx == current_block and sent_idx > current_sent)):
-                next_page_break = (block_idx, sent_idx)
-                break
-    
-        if next_page_break is None:
-            print("DEBUG: No PAGE BREAK found after current position")
+        next_break = bisect.bisect_right(page_breaks, (current_block, current_sent))
+        if next_break == len(page_breaks):
+            if _DEBUG:
+                print("DEBUG: No PAGE BREAK found after current position")
             return None
     
-        print(f"DEBUG: Next PAGE BREAK at block {next_page_break[0]}, sentence {next_page_break[1]}")
-    
-        # Find first element after the PAGE BREAK
-        search_block, search_sent = next_page_break
-    
-        # Start searching from the sentence after the PAGE BREAK
-        search_sent += 1
-    
-        # Search for first non-empty element
-        while search_block < len(self.sentence_boundary_data):
-            block_data = self.sentence_boundary_data[search_block]
-    
-            while search_sent < len(block_data['sentences']):
-                sentence_text = block_data['sentences'][search_sent].strip()
-                if sentence_text:  # Found non-empty sentence
-                    print(f"DEBUG: First element after PAGE BREAK: block {search_block}, sentence {search_sent}")
-                    return (search_block, search_sent)
-                search_sent += 1
-    
-            # Move to next block
-            search_block += 1
-            search_sent = 0
-    
-        print("DEBUG: No element found after PAGE BREAK")
-        return None
+        # First content after that PAGE BREAK, skipping pages with none
+        position = page_next_content[next_break + 1]
+        if _DEBUG:
+            if position is not None:
+                print(f"DEBUG: First element after PAGE BREAK: block {position[0]}, sentence {position[1]}")
+            else:
+                print("DEBUG: No element found after PAGE BREAK")
+        return position
    
     def _find_first_element_after_previous_horizontal_rule(self):
         """Find the first element after the previous PAGE BREAK block"""
         if not self.sentence_boundary_data:
             return None
     
-        # Get current TTS position
-        if hasattr(self, 'tts_manager') and self.tts_manager and hasattr(self.tts_manager, 'tts_sentence_index'):
-            current_block, current_sent = self.tts_manager.tts_sentence_index
-        else:
-            # Fallback to cursor position
-            cursor = self.text_edit.textCursor()
-            cursor_position = cursor.position()
-            current_position = self._convert_cursor_position_to_block_sentence(cursor_position)
-            if current_position is None:
-                return None
-            current_block, current_sent = current_position
+        current_block, current_sent = self._get_current_sentence_position()
+        if current_block is None:
+            return None
+        if _DEBUG:
+            print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
     
-        print(f"DEBUG: Current position: block {current_block}, sentence {current_sent}")
+        page_breaks, page_first_sentences = self._get_page_index()[:2]
     
-        # Find PAGE BREAK blocks in the document
-        page_break_blocks = []
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if block_data['sentences']:
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    sentence_text = sentence.strip()
-                    # Check for PAGE BREAK pattern
-                    if sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit():
-                        page_break_blocks.append((block_idx, sent_idx))
-                        print(f"DEBUG: Found PAGE BREAK at block {block_idx}, sentence {sent_idx}")
-    
-        if not page_break_blocks:
-            print("DEBUG: No PAGE BREAK blocks found - jumping to document start")
-            # No horizontal rules exist, go to first sentence of document
-            for block_idx, block_data in enumerate(self.sentence_boundary_data):
-                if block_data['sentences']:
-                    for sent_idx, sentence in enumerate(block_data['sentences']):
-                        sentence_text = sentence.strip()
-                        if sentence_text:  # Found first non-empty sentence
-                            print(f"DEBUG: First sentence in document: block {block_idx}, sentence {sent_idx}")
-                            return (block_idx, sent_idx)
-            return None
+        # The current page is the one ending at the first PAGE BREAK at or after
+        # the current position (no PAGE BREAKs means one page: go to document start)
+        current_page = bisect.bisect_left(page_breaks, (current_block, current_sent))
+        current_page_first_sentence = page_first_sentences[current_page]
+        if _DEBUG:
+            print(f"DEBUG: Current page {current_page}, first sentence: {current_page_first_sentence}")
     
-        # Find the current "page" (section between PAGE BREAKs)
-        current_page_start = None
-        current_page_end = None
-        
-        # Find which page we're currently in
-        for i, (block_idx, sent_idx) in enumerate(page_break_blocks):
-            if (current_block < block_idx or 
-                (current_block == block_idx and current_sent <= sent_idx)):
-                # Current position is before this PAGE BREAK
-                current_page_end = (block_idx, sent_idx)
-                current_page_start = page_break_blocks[i-1] if i > 0 else None
-                break
-        
-        # If we didn't find a page end, we're in the last page
-        if current_page_end is None:
-            current_page_start = page_break_blocks[-1] if page_break_blocks else None
-        
-        print(f"DEBUG: Current page start: {current_page_start}, end: {current_page_end}")
-        
-        # Find first sentence of current page
-        if current_page_start is None:
-            # We're in the first page (before first PAGE BREAK)
-            search_block, search_sent = 0, 0
-        else:
-            # Start searching after the PAGE BREAK that starts this page
-            search_block, search_sent = current_page_start
-            search_sent += 1  # Move past the PAGE BREAK sentence
-        
-        current_page_first_sentence = None
-        while search_block < len(self.sentence_boundary_data):
-            if current_page_end and (search_block > current_page_end[0] or 
-                                    (search_block == current_page_end[0] and search_sent >= current_page_end[1])):
-                break
-                
-            block_data = self.sentence_boundary_data[search_block]
-            while search_sent < len(block_data['sentences']):
-                if current_page_end and search_block == current_page_end[0] and search_sent >= current_page_end[1]:
-                    break
-                    
-                sentence_text = block_data['sentences'][search_sent].strip()
-                if sentence_text and not (sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit()):
-                    current_page_first_sentence = (search_block, search_sent)
-                    break
-                search_sent += 1
-            
-            if current_page_first_sentence:
-                break
-            search_block += 1
-            search_sent = 0
-        
-        print(f"DEBUG: Current page first sentence: {current_page_first_sentence}")
-        
-        # Check if we're already at the first sentence of current page
-        if (current_page_first_sentence and 
-            current_block == current_page_first_sentence[0] and 
-            current_sent == current_page_first_sentence[1]):
-            print("DEBUG: Already at first sentence of current page, finding previous page")
-            
-            # Find previous page
-            if current_page_start is None:
-                # We're in first page, no previous page
-                print("DEBUG: Already in first page, no previous page")
-                return current_page_first_sentence  # Stay at first sentence
-            else:
-                # Find the PAGE BREAK before current_page_start
-                prev_page_start = None
-                for i, (block_idx, sent_idx) in enumerate(page_break_blocks):
-                    if (block_idx, sent_idx) == current_page_start:
-                        prev_page_start = page_break_blocks[i-1] if i > 0 else None
-                        break
-                
-                print(f"DEBUG: Previous page start: {prev_page_start}")
-                
-                # Find first sentence of previous page
-                if prev_page_start is None:
-                    # Previous page is the very first page
-                    search_block, search_sent = 0, 0
-                else:
-                    search_block, search_sent = prev_page_start
-                    search_sent += 1  # Move past the PAGE BREAK
-                
-                while search_block < len(self.sentence_boundary_data):
-                    if (current_page_start and 
-                        (search_block > current_page_start[0] or 
-                         (search_block == current_page_start[0] and search_sent >= current_page_start[1]))):
-                        break
-                        
-                    block_data = self.sentence_boundary_data[search_block]
-                    while search_sent < len(block_data['sentences']):
-                        if (current_page_start and 
-                            search_block == current_page_start[0] and search_sent >= current_page_start[1]):
-                            break
-                            
-                        sentence_text = block_data['sentences'][search_sent].strip()
-                        if sentence_text and not (sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit()):
-                            print(f"DEBUG: First sentence of previous page: block {search_block}, sentence {search_sent}")
-                            return (search_block, search_sent)
-                        search_sent += 1
-                    
-                    search_block += 1
-                    search_sent = 0
-                
-                print("DEBUG: No content found in previous page")
-                return None
-        else:
-            # Not at first sentence of current page, go to current page first sentence
-            print(f"DEBUG: Going to current page first sentence: {current_page_first_sentence}")
-            return current_page_first_sentence
+        # Already at the first sentence of the page: go to the previous page,
+        # or stay put on the first page
+        if (current_page > 0 and
+            current_page_first_sentence == (current_block, current_sent)):
+            if _DEBUG:
+                print(f"DEBUG: First sentence of previous page: {page_first_sentences[current_page - 1]}")
+            return page_first_sentences[current_page - 1]
+    
+        return current_page_first_sentence
 
     def get_current_sentence_page_number(self):
         """Get the page number of the current sentence being read"""
         if not self.sentence_boundary_data:
             return 1
         
-        # Get current TTS position
-        if hasattr(self, 'tts_manager') and self.tts_manager and hasattr(self.tts_manager, 'tts_sentence_index'):
-            current_block, current_sent = self.tts_manager.tts_sentence_index
-        else:
-            # Fallback to cursor position
-            cursor = self.text_edit.textCursor()
-            cursor_position = cursor.position()
-            current_position = self._convert_cursor_position_to_block_sentence(cursor_position)
-            if current_position is None:
-                return 1
-            current_block, current_sent = current_position
-        
-        print(f"DEBUG: Current TTS position: block {current_block}, sentence {current_sent}")
-        
-        # Find PAGE BREAK blocks in the document
-        page_break_blocks = []
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if block_data['sentences']:
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    sentence_text = sentence.strip()
-                    # Check for PAGE BREAK pattern
-                    if sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit():
-                        page_break_blocks.append((block_idx, sent_idx))
-                        print(f"DEBUG: Found PAGE BREAK at block {block_idx}, sentence {sent_idx}")
-        
-        if not page_break_blocks:
-            # No page breaks exist, everything is page 1
+        current_block, current_sent = self._get_current_sentence_position()
+        if current_block is None:
             return 1
+        if _DEBUG:
+            print(f"DEBUG: Current TTS position: block {current_block}, sentence {current_sent}")
         
-        # Count how many PAGE BREAK blocks are before the current sentence position
-        page_breaks_before_current = 0
-        for block_idx, sent_idx in page_break_blocks:
-            if (block_idx < current_block or 
-                (block_idx == current_block and sent_idx < current_sent)):
-                page_breaks_before_current += 1
-            else:
-                break
-        
-        # Page number is the number of page breaks before current position + 1
-        page_number = page_breaks_before_current + 1
+        # Page number is the number of PAGE BREAKs before the current position + 1
+        page_breaks = self._get_page_index()[0]
+        page_number = bisect.bisect_left(page_breaks, (current_block, current_sent)) + 1
         
-        print(f"DEBUG: {page_breaks_before_current} page breaks before current position, page number: {page_number}")
+        if _DEBUG:
+            print(f"DEBUG: {page_number - 1} page breaks before current position, page number: {page_number}")
         return page_number
 
     def show_go_to_page_dialog(self):
         """Show go to page dialog for TTS widget"""
         if not self.sentence_boundary_data:
-            print("DEBUG: No sentence boundary data available")
+            if _DEBUG:
+                print("DEBUG: No sentence boundary data available")
             return
     
         # Count total pages
@@ -1380,7 +1336,8 @@ class ReadOnlyTTSWidget(QMainWindow):
         current_page = self.get_current_sentence_page_number()
     
         if total_pages <= 0:
-            print("DEBUG: No pages found")
+            if _DEBUG:
+                print("DEBUG: No pages found")
             return
     
         from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton
@@ -1434,16 +1391,9 @@ class ReadOnlyTTSWidget(QMainWindow):
         if not self.sentence_boundary_data:
             return 0
     
-        page_breaks = 0
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if block_data['sentences']:
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    sentence_text = sentence.strip()
-                    if sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit():
-                        page_breaks += 1
-    
-        # If no page breaks, assume 1 page
-        return max(1, page_breaks + 1)
+        # One page more than there are PAGE BREAKs
+        page_breaks = self._get_page_index()[0]
+        return len(page_breaks) + 1
     
     def jump_to_page_and_start(self, page_number):
         """Jump to specific page and start TTS from first sentence of that page"""
@@ -1453,10 +1403,11 @@ class ReadOnlyTTSWidget(QMainWindow):
         first_sentence_of_page = self._find_first_sentence_of_page(page_number)
         if first_sentence_of_page is not None:
             block_idx, sent_idx = first_sentence_of_page
-            print(f"DEBUG: Jumping to page {page_number}, block {block_idx}, sentence {sent_idx}")
+            if _DEBUG:
+                print(f"DEBUG: Jumping to page {page_number}, block {block_idx}, sentence {sent_idx}")
     
             # Set TTS position and navigate
-            if hasattr(self, 'tts_manager') and self.tts_manager:
+            if self.tts_manager is not None:
                 self.tts_manager.set_sentence_index(block_idx, sent_idx)
                 self._scroll_to_position(block_idx, sent_idx)
     
@@ -1471,67 +1422,40 @@ class ReadOnlyTTSWidget(QMainWindow):
         if not self.sentence_boundary_data or page_number < 1:
             return None
     
-        # Find PAGE BREAK blocks
-        page_break_blocks = []
-        for block_idx, block_data in enumerate(self.sentence_boundary_data):
-            if block_data['sentences']:
-                for sent_idx, sentence in enumerate(block_data['sentences']):
-                    sentence_text = sentence.strip()
-                    if sentence_text.startswith('PAGE BREAK ') and sentence_text.split()[-1].isdigit():
-                        page_break_blocks.append((block_idx, sent_idx))
-    
-        if page_number == 1:
-            # First page - find first non-empty sentence
-            for block_idx, block_data in enumerate(self.sentence_boundary_data):
-                if block_data['sentences']:
-                    for sent_idx, sentence in enumerate(block_data['sentences']):
-                        sentence_text = sentence.strip()
-                        if sentence_text and not sentence_text.startswith('PAGE BREAK '):
-                            return (block_idx, sent_idx)
-            return None
-    
-        # For pages > 1, find the appropriate page break
-        if page_number - 2 >= len(page_break_blocks):
+        page_next_content = self._get_page_index()[2]
+        if page_number > len(page_next_content):
             return None
     
-        # Start searching after the (page_number - 2)th page break
-        search_block, search_sent = page_break_blocks[page_number - 2]
-        search_sent += 1  # Start after the page break
-    
-        # Find first non-empty sentence
-        while search_block < len(self.sentence_boundary_data):
-            block_data = self.sentence_boundary_data[search_block]
-    
-            while search_sent < len(block_data['sentences']):
-                sentence_text = block_data['sentences'][search_sent].strip()
-                if sentence_text and not sentence_text.startswith('PAGE BREAK '):
-                    return (search_block, search_sent)
-                search_sent += 1
-    
-            search_block += 1
-            search_sent = 0
-    
-        return None
+        # First content from the start of that page on, skipping pages with none
+        return page_next_content[page_number - 1]
 
     def start_tts_from_cursor_position(self, cursor_position):
         """Start TTS from a specific cursor position in the document"""
-        if hasattr(self, 'tts_manager') and self.text_edit.document() and not self.text_edit.document().isEmpty():
+        # The position can only be mapped to a sentence once detection has finished
+        if not self.is_ready:
+            self._run_when_ready(lambda: self.start_tts_from_cursor_position(cursor_position))
+            return
+        
+        if self.tts_manager is not None and self.text_edit.document() and not self.text_edit.document().isEmpty():
             # Set cursor to the specified position
             cursor = self.text_edit.textCursor()
             cursor.setPosition(min(cursor_position, self.text_edit.document().characterCount() - 1))
             self.text_edit.setTextCursor(cursor)
             self.text_edit.ensureCursorVisible()
             
-            print(f"DEBUG: Starting TTS from cursor position {cursor_position}")
+            if _DEBUG:
+                print(f"DEBUG: Starting TTS from cursor position {cursor_position}")
             
             # Convert cursor position to block/sentence coordinates
             block_idx, sent_idx = self._convert_cursor_position_to_block_sentence(cursor_position)
             if block_idx is not None and sent_idx is not None:
-                print(f"DEBUG: Converted to block {block_idx}, sentence {sent_idx}")
+                if _DEBUG:
+                    print(f"DEBUG: Converted to block {block_idx}, sentence {sent_idx}")
                 # Set the TTS manager to start from this position
                 self.tts_manager.set_sentence_index(block_idx, sent_idx)
             else:
-                print("DEBUG: Could not convert cursor position, using default (0,0)")
+                if _DEBUG:
+                    print("DEBUG: Could not convert cursor position, using default (0,0)")
                 self.tts_manager.reset_sentence_index()
             
             # Start TTS from the set position
@@ -1545,7 +1469,13 @@ class ReadOnlyTTSWidget(QMainWindow):
 
     def jump_to_cursor_position_and_start(self, cursor_position):
         """Jump to cursor position and start/restart TTS from there"""
-        print(f"DEBUG: jump_to_cursor_position_and_start called with position {cursor_position}")
+        # The position can only be mapped to a sentence once detection has finished
+        if not self.is_ready:
+            self._run_when_ready(lambda: self.jump_to_cursor_position_and_start(cursor_position))
+            return
+        
+        if _DEBUG:
+            print(f"DEBUG: jump_to_cursor_position_and_start called with position {cursor_position}")
         
         # Set cursor to the specified position
         cursor = self.text_edit.textCursor()
@@ -1556,15 +1486,17 @@ class ReadOnlyTTSWidget(QMainWindow):
         # Convert cursor position to block/sentence coordinates
         block_idx, sent_idx = self._convert_cursor_position_to_block_sentence(cursor_position)
         if block_idx is not None and sent_idx is not None:
-            print(f"DEBUG: Converted to block {block_idx}, sentence {sent_idx}")
+            if _DEBUG:
+                print(f"DEBUG: Converted to block {block_idx}, sentence {sent_idx}")
             # Set the TTS manager to the new position
             self.tts_manager.set_sentence_index(block_idx, sent_idx)
         else:
-            print("DEBUG: Could not convert cursor position, using default (0,0)")
+            if _DEBUG:
+                print("DEBUG: Could not convert cursor position, using default (0,0)")
             self.tts_manager.reset_sentence_index()
         
         # If TTS is already running, stop it and restart from new position
-        if hasattr(self, 'tts_manager'):
+        if self.tts_manager is not None:
             if self.tts_manager.is_speaking:
                 # Stop current TTS
                 self.tts_manager.stop_speech()
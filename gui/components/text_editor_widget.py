@@ -686,7 +686,7 @@ class TextEditorWidget(QWidget):
 
         # Update UI elements
         if hasattr(self, 'line_number_area'):
-            self.line_number_area.update_width()
+            self.line_number_area.update_width(force=True)
 
         # Emit signal
         self.zoomChanged.emit(self.zoom_level)
@@ -734,19 +734,8 @@ class TextEditorWidget(QWidget):
             # Create new PDF viewer window using file manager
             self.pdf_viewer_window = self.file_manager.open_original_pdf()
             if self.pdf_viewer_window:
-                # Use a timer to jump to the page after the PDF is loaded
-                from PySide6.QtCore import QTimer
-                def delayed_jump():
-                    print(f"DEBUG: Delayed calling go_to_page({current_page}) on new window")
-                    print(f"DEBUG: PDF viewer total_pages: {self.pdf_viewer_window.total_pages}")
-                    self.pdf_viewer_window.go_to_page(current_page)
-                
-                # Try immediately first
+                # Jumps right away, or as soon as the PDF has finished loading
                 self.pdf_viewer_window.go_to_page(current_page)
-                # Then try again after 500ms delay to ensure PDF is loaded
-                QTimer.singleShot(500, delayed_jump)
-                # And one more try after 1 second if needed
-                QTimer.singleShot(1000, delayed_jump)
 
     def cleanup_audio_resources(self):
         """Clean up audio resources when widget is being closed"""
@@ -226,14 +226,18 @@ class FileManager(QObject):
                     # Extraction completed successfully
                     final_asvx = extraction_dialog.get_extracted_text()
                     if final_asvx:
-                        # Add asvx PDF tag at the beginning
-                        asvx_tag = "{"+f"asvx|pdf:{file_path}"+"}\n\n"
-                        final_asvx = asvx_tag + final_asvx
-                
-                        # Load ASVX content using ASVX handler
+                        # Load ASVX content using ASVX handler; the PDF path goes
+                        # in as metadata so the extracted text isn't copied to add a tag
                         from gui.components.asvx_handler import ASVXHandler
-                        self.text_editor.document().clear()
-                        metadata = ASVXHandler.asvx_to_rich_text(self.text_editor.document(), final_asvx)
+                        document = self.text_editor.document()
+                        
+                        # There is nothing to undo back to, so don't record an
+                        # undo step for every inserted block
+                        undo_enabled = document.isUndoRedoEnabled()
+                        document.setUndoRedoEnabled(False)
+                        document.clear()
+                        metadata = ASVXHandler.asvx_to_rich_text(document, final_asvx, pdf_path=file_path)
+                        document.setUndoRedoEnabled(undo_enabled)
                         
                         # Set original PDF path from metadata
                         if metadata and 'pdf_path' in metadata:
@@ -266,14 +270,18 @@ class FileManager(QObject):
                     # OCR completed successfully
                     final_asvx = ocr_dialog.get_ocr_result()
                     if final_asvx:
-                        # Add asvx PDF tag at the beginning
-                        asvx_tag = "{"+f"asvx|pdf:{file_path}"+"}\n\n"
-                        final_asvx = asvx_tag + final_asvx
-                        
-                        # Load ASVX content using ASVX handler
+                        # Load ASVX content using ASVX handler; the PDF path goes
+                        # in as metadata so the OCR text isn't copied to add a tag
                         from gui.components.asvx_handler import ASVXHandler
-                        self.text_editor.document().clear()
-                        metadata = ASVXHandler.asvx_to_rich_text(self.text_editor.document(), final_asvx)
+                        document = self.text_editor.document()
+                        
+                        # There is nothing to undo back to, so don't record an
+                        # undo step for every inserted block
+                        undo_enabled = document.isUndoRedoEnabled()
+                        document.setUndoRedoEnabled(False)
+                        document.clear()
+                        metadata = ASVXHandler.asvx_to_rich_text(document, final_asvx, pdf_path=file_path)
+                        document.setUndoRedoEnabled(undo_enabled)
                         
                         # Set original PDF path from metadata
                         if metadata and 'pdf_path' in metadata:
@@ -381,7 +389,7 @@ class FileManager(QObject):
             return
 
         # Create and show the PDF viewer window
-        from gui.components.pdf_handler import PDFViewerWindow
+        from gui.components.pdf_viewer import PDFViewerWindow
 
         # Create new window - let the calling code manage window references
         pdf_viewer_window = PDFViewerWindow(self.original_pdf_path, self.parent())
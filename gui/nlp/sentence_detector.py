@@ -5,6 +5,7 @@ Supports both nupunkt and spaCy methods
 """
 
 from PySide6.QtGui import QTextDocument, QTextCursor
+from PySide6.QtCore import QThread, Signal
 from typing import List, Dict, Tuple
 import json
 
@@ -29,7 +30,6 @@ except ImportError:
     SPACY_AVAILABLE = False
     print("Warning: spaCy not available")
 
-
 class SentenceDetector:
     """Main sentence boundary detection class"""
     
@@ -236,3 +236,43 @@ class SentenceDetector:
             methods["spacy"] = "spaCy (Not Available)"
             
         return methods
+
+
+class SentenceDetectionThread(QThread):
+    """Thread for running sentence detection without blocking the GUI"""
+    detection_complete = Signal(list)  # Emits the sentence_boundary_data list
+    
+    def __init__(self, detector, document, parent=None):
+        super().__init__(parent)
+        self.detector = detector
+        # Work on a private copy so the displayed document is never read concurrently
+        self.document = document.clone()
+    
+    def run(self):
+        try:
+            results = self.detector.detect_sentences_in_document(self.document)
+        except Exception as e:
+            print(f"Error in sentence detection: {e}")
+            results = []
+        
+        self.detection_complete.emit(results)
+
+
+# Detector shared across windows so tokenizers are only built once
+_shared_detector = None
+
+
+def get_shared_detector(config_path=None):
+    """
+    Return the shared SentenceDetector for config_path, creating it on first use
+    
+    The configured method is re-read on reuse so settings changes still apply.
+    """
+    global _shared_detector
+    
+    if _shared_detector is None or _shared_detector.config_path != config_path:
+        _shared_detector = SentenceDetector(config_path)
+    else:
+        _shared_detector.method = _shared_detector._load_method_from_config()
+    
+    return _shared_detector